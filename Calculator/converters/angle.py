@@ -7,43 +7,42 @@ Features:
 - Local history file recording for conversions.
 """
 
+import sys
 from decimal import Decimal, localcontext
+from functools import lru_cache
 from typing import Tuple, Callable, Dict
 from enum import IntEnum
 
 from calculator.converters.base import BaseConverter
-from calculator.exceptions import CalculatorError, NullInputError, InvalidInputError
+from calculator.exceptions import NullInputError, InvalidInputError
 from calculator.converters.converter_utils import get_numeric_input, format_numeric_result, to_decimal
 from calculator.config import ANGLE_HISTORY_FILE
+from calculator.utils import read_menu_choice
 
 
 INTERNAL_PRECISION = 60
 HISTORY_FILE = ANGLE_HISTORY_FILE
 
 
-def _compute_pi() -> Decimal:
-    """
-    Compute PI using the Gauss-Legendre algorithm.
+# PI to 80 significant digits; comfortably above INTERNAL_PRECISION.
+_PI_DIGITS = (
+    "3.1415926535897932384626433832795028841971693993751058209749445923078164062862089"
+)
 
-    Returns:
-        PI with INTERNAL_PRECISION decimal digits.
-    """
-    with localcontext() as ctx:
-        ctx.prec = INTERNAL_PRECISION
-        a = Decimal(1)
-        b = Decimal(1) / Decimal(2).sqrt()
-        t = Decimal(1) / Decimal(4)
-        p = Decimal(1)
-        for _ in range(7):
-            an = (a + b) / 2
-            b = (a * b).sqrt()
-            t = t - p * (a - an) * (a - an)
-            a = an
-            p = p * 2
-        return (a + b) * (a + b) / (Decimal(4) * t)
 
+# Degrees and gradians in a half turn, built once rather than per call.
+_HALF_TURN_DEG = Decimal(180)
+_HALF_TURN_GRAD = Decimal(200)
 
-PI = _compute_pi()
+# PI and the deg->rad, rad->deg, rad->grad and grad->rad multipliers, built
+# once at INTERNAL_PRECISION so each conversion is a single multiply.
+with localcontext() as _ctx:
+    _ctx.prec = INTERNAL_PRECISION
+    PI = +Decimal(_PI_DIGITS)
+    _DEG_TO_RAD = PI / _HALF_TURN_DEG
+    _RAD_TO_DEG = _HALF_TURN_DEG / PI
+    _RAD_TO_GRAD = _HALF_TURN_GRAD / PI
+    _GRAD_TO_RAD = PI / _HALF_TURN_GRAD
 
 
 class AngleUnit(IntEnum):
@@ -54,20 +53,33 @@ class AngleUnit(IntEnum):
     QUIT = 4
 
 
+# Plain ints for per-call comparisons; AngleUnit.X is a class attribute lookup.
+_DEGREE = int(AngleUnit.DEGREE)
+_RADIAN = int(AngleUnit.RADIAN)
+_GRADIAN = int(AngleUnit.GRADIAN)
+
+
 # ============================================================================
 # Menu Display Functions
 # ============================================================================
 
+_ANGLE_MENU = "\n".join([
+    "",
+    "=" * 50,
+    "ANGLE CONVERSION",
+    "=" * 50,
+    "1. Degree (°)",
+    "2. Radian (rad)",
+    "3. Gradian (grad)",
+    "4. Quit Angle Converter",
+    "=" * 50,
+    "",
+])
+
+
 def angle_conversion_menuMsg() -> None:
     """Display angle conversion menu."""
-    print("\n" + "="*50)
-    print("ANGLE CONVERSION")
-    print("="*50)
-    print("1. Degree (°)")
-    print("2. Radian (rad)")
-    print("3. Gradian (grad)")
-    print("4. Quit Angle Converter")
-    print("="*50)
+    sys.stdout.write(_ANGLE_MENU)
 
 
 # ============================================================================
@@ -76,32 +88,32 @@ def angle_conversion_menuMsg() -> None:
 
 def to_rads(angle: Decimal) -> Decimal:
     """Convert degrees to radians."""
-    return to_decimal(angle, "Angle") * PI / Decimal(180)
+    return to_decimal(angle, "Angle") * _DEG_TO_RAD
 
 
 def to_deg(angle: Decimal) -> Decimal:
     """Convert radians to degrees."""
-    return to_decimal(angle, "Angle") * Decimal(180) / PI
+    return to_decimal(angle, "Angle") * _RAD_TO_DEG
 
 
 def to_grad(angle: Decimal) -> Decimal:
     """Convert degrees to gradians."""
-    return to_decimal(angle, "Angle") * Decimal(200) / Decimal(180)
+    return to_decimal(angle, "Angle") * _HALF_TURN_GRAD / _HALF_TURN_DEG
 
 
 def grad_to_deg(angle: Decimal) -> Decimal:
     """Convert gradians to degrees."""
-    return to_decimal(angle, "Angle") * Decimal(180) / Decimal(200)
+    return to_decimal(angle, "Angle") * _HALF_TURN_DEG / _HALF_TURN_GRAD
 
 
 def rad_to_grad(angle: Decimal) -> Decimal:
     """Convert radians to gradians."""
-    return to_grad(to_deg(angle))
+    return to_decimal(angle, "Angle") * _RAD_TO_GRAD
 
 
 def grad_to_rad(angle: Decimal) -> Decimal:
     """Convert gradians to radians."""
-    return to_rads(grad_to_deg(angle))
+    return to_decimal(angle, "Angle") * _GRAD_TO_RAD
 
 
 def convert_angle_value(value: Decimal, from_unit: int, to_unit: int) -> Decimal:
@@ -110,20 +122,20 @@ def convert_angle_value(value: Decimal, from_unit: int, to_unit: int) -> Decimal
     if from_unit == to_unit:
         return normalized_value
 
-    if from_unit == AngleUnit.DEGREE:
+    if from_unit == _DEGREE:
         degrees = normalized_value
-    elif from_unit == AngleUnit.RADIAN:
+    elif from_unit == _RADIAN:
         degrees = to_deg(normalized_value)
-    elif from_unit == AngleUnit.GRADIAN:
+    elif from_unit == _GRADIAN:
         degrees = grad_to_deg(normalized_value)
     else:
         raise InvalidInputError("Invalid angle unit.")
 
-    if to_unit == AngleUnit.DEGREE:
+    if to_unit == _DEGREE:
         return degrees
-    if to_unit == AngleUnit.RADIAN:
+    if to_unit == _RADIAN:
         return to_rads(degrees)
-    if to_unit == AngleUnit.GRADIAN:
+    if to_unit == _GRADIAN:
         return to_grad(degrees)
 
     raise InvalidInputError("Invalid angle unit.")
@@ -146,6 +158,23 @@ def convert_angle(
     return ans1, ans2
 
 
+@lru_cache(maxsize=256)
+def _convert_angle_cached(choice: int, angle_text: str) -> Tuple[str, str]:
+    """Cached convert_angle keyed by menu choice and the angle's exact text."""
+    _, name1, func1, name2, func2 = _ANGLE_CONV_TABLE[choice]
+    return convert_angle(name1, func1, name2, func2, Decimal(angle_text))
+
+
+def convert_angle_choice(choice: int, angle: Decimal) -> Tuple[str, str]:
+    """
+    Convert an angle for a menu choice, reusing results for repeated inputs.
+
+    The cache key is the angle's text, not its value: Decimal("1.0") and
+    Decimal("1") are equal but display differently in the result strings.
+    """
+    return _convert_angle_cached(int(choice), str(to_decimal(angle, "Angle")))
+
+
 def record_history_angle_conv(unit_name: str, angle: Decimal, ans1: str, ans2: str) -> None:
     """Append angle conversion to history file."""
     try:
@@ -186,7 +215,7 @@ def clear_hist_angle_conv() -> None:
 # Conversion Lookup Tables
 # ============================================================================
 
-angle_conv_choices = ["Degree", "Radians", "Gradians"]
+angle_conv_choices = ("Degree", "Radians", "Gradians")
 ANGLE_UNIT_NAMES = {
     AngleUnit.DEGREE: "Degree",
     AngleUnit.RADIAN: "Radian",
@@ -205,6 +234,16 @@ angle_conv_funcs: Dict[int, Tuple[str, Callable, str, Callable]] = {
     AngleUnit.GRADIAN: ("deg", grad_to_deg, "rad", grad_to_rad),
 }
 
+# Plain-int menu choices that have a conversion entry.
+_VALID_ANGLE_CHOICES = frozenset(int(unit) for unit in angle_conv_funcs)
+
+# (unit_name, name1, func1, name2, func2) indexed directly by menu choice
+# (slot 0 unused), so one lookup yields everything a conversion needs.
+_ANGLE_CONV_TABLE = (None,) + tuple(
+    (angle_conv_choices[unit - 1], *angle_conv_funcs[unit])
+    for unit in sorted(angle_conv_funcs)
+)
+
 
 class AngleConverter(BaseConverter):
     """Generic angle converter compatible with the shared converter UI."""
@@ -230,30 +269,22 @@ class AngleConverter(BaseConverter):
 
 def angle_converter() -> None:
     """Main angle conversion interface."""
-    try:
-        angle_conversion_menuMsg()
-        choice = int(input("\nEnter your choice: "))
-
-        if choice == AngleUnit.QUIT:
-            return
-
-        if choice in angle_conv_funcs:
-            name1, func1, name2, func2 = angle_conv_funcs[choice]
-            unit_name = angle_conv_choices[choice - 1]
-            print(f"\nEnter angle in {unit_name}: ", end="")
-            angle = get_numeric_input()
-
-            if angle is not None:
-                ans1, ans2 = convert_angle(name1, func1, name2, func2, angle)
-                record_history_angle_conv(unit_name, angle, ans1, ans2)
-                print(f"\n   {ans1}")
-                print(f"   {ans2}\n")
-            else:
-                raise NullInputError()
-    
-    except ValueError:
+    angle_conversion_menuMsg()
+    choice = read_menu_choice("\nEnter your choice: ")
+    if choice is None:
         raise InvalidInputError("Invalid choice: Please select 1-3\n")
-    except (TypeError, CalculatorError):
-        raise
 
+    if choice == AngleUnit.QUIT:
+        return
+
+    if choice in _VALID_ANGLE_CHOICES:
+        unit_name = _ANGLE_CONV_TABLE[choice][0]
+        print(f"\nEnter angle in {unit_name}: ", end="")
+        angle = get_numeric_input()
 
+        if angle is not None:
+            ans1, ans2 = convert_angle_choice(choice, angle)
+            record_history_angle_conv(unit_name, angle, ans1, ans2)
+            print(f"\n   {ans1}\n   {ans2}\n")
+        else:
+            raise NullInputError()
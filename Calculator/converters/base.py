@@ -7,6 +7,7 @@ all unit converters (temperature, pressure, weight, data, etc.).
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from pathlib import Path
@@ -15,6 +16,10 @@ from typing import Dict, Tuple
 from calculator.config import MENU_WIDTH
 from calculator.converters.converter_utils import get_numeric_input, format_numeric_result
 from calculator.exceptions import NullInputError, InvalidInputError
+from calculator.utils import read_menu_choice
+
+# Menu / result separator; MENU_WIDTH is a name, so the compiler cannot fold it.
+_BAR = "=" * MENU_WIDTH
 
 class BaseConverter(ABC):
     """
@@ -51,15 +56,15 @@ class BaseConverter(ABC):
 
     def display_menu(self) -> None:
         """Display converter menu with all available units."""
-        print("\n" + "=" * MENU_WIDTH)
+        print("\n" + _BAR)
         header = f"{self.emoji}  {self.name} CONVERSION" if self.emoji else f"{self.name} CONVERSION"
         print(header)
-        print("=" * MENU_WIDTH)
+        print(_BAR)
         for unit_id, (name, abbrev) in self.units.items():
             print(f"  {unit_id:2d}. {name} ({abbrev})")
         quit_id = max(self.units.keys()) + 1
         print(f"\n  {quit_id:2d}. Quit {self.name.title()} Converter")
-        print("=" * MENU_WIDTH)
+        print(_BAR)
 
     def get_value_prompt(self, unit_name: str) -> str:
         """Prompt shown for entering the value."""
@@ -112,6 +117,36 @@ class BaseConverter(ABC):
         except (FileNotFoundError, PermissionError, UnicodeDecodeError, OSError):
             print(f"Internal Error: Failed to clear {self.name.lower()} history")
 
+    def _read_unit_pair(self) -> Tuple[int, int] | None:
+        """
+        Read and validate the FROM / TO unit selection.
+
+        Returns:
+            (from_unit, to_unit), or None when the user quits or picks the
+            same unit twice.
+
+        Raises:
+            InvalidInputError: If a choice is not an integer or not a listed unit.
+        """
+        last_unit = max(self.units)
+        quit_id = last_unit + 1
+        pair = []
+        for prompt in ("\nEnter FROM unit: ", "Enter TO unit: "):
+            unit = read_menu_choice(prompt)
+            if unit is None:
+                raise InvalidInputError("Please enter a valid unit number")
+            if unit == quit_id:
+                return None
+            if unit not in self.units:
+                raise InvalidInputError(f"Invalid choice. Please select 1-{last_unit}.")
+            pair.append(unit)
+
+        from_unit, to_unit = pair
+        if from_unit == to_unit:
+            print("\nInput and output units are the same. No conversion needed.\n")
+            return None
+        return from_unit, to_unit
+
     def run(self) -> None:
         """
         Main conversion interface.
@@ -122,46 +157,33 @@ class BaseConverter(ABC):
         - Read numeric value
         - Convert, format, record history, print result
         """
-        try:
-            self.display_menu()
+        self.display_menu()
 
-            from_unit = int(input("\nEnter FROM unit: "))
-            quit_id = max(self.units.keys()) + 1
-            if from_unit == quit_id:
-                return
-            if from_unit not in self.units:
-                raise InvalidInputError(f"Invalid choice. Please select 1-{max(self.units.keys())}.")
-
-            to_unit = int(input("Enter TO unit: "))
-            if to_unit == quit_id:
-                return
-            if to_unit not in self.units:
-                raise InvalidInputError(f"Invalid choice. Please select 1-{max(self.units.keys())}.")
-        
-            if from_unit == to_unit:
-                print("\nInput and output units are the same. No conversion needed.\n")
-                return
+        pair = self._read_unit_pair()
+        if pair is None:
+            return
+        from_unit, to_unit = pair
 
-            unit_name = self.units[from_unit][0]
-            value = get_numeric_input(self.get_value_prompt(unit_name))
-            if value is None:
-                raise NullInputError()
+        unit_name = self.units[from_unit][0]
+        value = get_numeric_input(self.get_value_prompt(unit_name))
+        if value is None:
+            raise NullInputError()
 
-            result = self.convert(value, from_unit, to_unit)
-            formatted_result = self.format_result(result)
-            self.record_history(value, from_unit, to_unit, formatted_result)
+        result = self.convert(value, from_unit, to_unit)
+        formatted_result = self.format_result(result)
+        self.record_history(value, from_unit, to_unit, formatted_result)
 
-            from_name, from_abbrev = self.units[from_unit]
-            to_name, to_abbrev = self.units[to_unit]
+        from_name, from_abbrev = self.units[from_unit]
+        to_name, to_abbrev = self.units[to_unit]
 
-            print("\n" + "=" * MENU_WIDTH)
-            print("   CONVERSION RESULT:")
-            print(f"   {value} {from_abbrev} = {formatted_result} {to_abbrev}")
-            print(f"   ({from_name} -> {to_name})")
-            print("=" * MENU_WIDTH + "\n")
+        sys.stdout.write(
+            f"\n{_BAR}\n"
+            "   CONVERSION RESULT:\n"
+            f"   {value} {from_abbrev} = {formatted_result} {to_abbrev}\n"
+            f"   ({from_name} -> {to_name})\n"
+            f"{_BAR}\n\n"
+        )
 
-        except ValueError:
-            raise InvalidInputError("Please enter a valid unit number")
     history_file: Path | None = None
 
 
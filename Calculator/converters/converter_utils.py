@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
 from typing import Optional
-from calculator.exceptions import ExpressionError, CalculatorError, NullInputError
+from calculator.exceptions import ExpressionError, NullInputError
 
 
 def to_decimal(value, value_type: str = "Value") -> Decimal:
@@ -25,6 +25,12 @@ def to_decimal(value, value_type: str = "Value") -> Decimal:
     Returns:
         Decimal representation
     """
+    # Exact-type checks first: these are the common cases.
+    exact_type = type(value)
+    if exact_type is Decimal:
+        return value
+    if exact_type is int:
+        return Decimal(value)
     if isinstance(value, Decimal):
         return value
     # Prevent bool from passing via int subclassing.
@@ -47,7 +53,7 @@ def get_numeric_input(prompt: str = "") -> Optional[Decimal]:
     """
     try:
         raw = input(prompt).strip()
-        if raw == "":
+        if not raw:
             raise NullInputError()
         return Decimal(raw)
     except (ValueError, InvalidOperation):
@@ -56,6 +62,28 @@ def get_numeric_input(prompt: str = "") -> Optional[Decimal]:
         raise TypeError("Invalid Type: Cannot perform operations on text. Please use numbers only.")
 
 
+def strip_trailing_zeros(formatted: str) -> str:
+    """
+    Remove trailing fractional zeros from a formatted number.
+
+    Decimal keeps the exponent of its operands, so products such as
+    ``2.50 * 0.001`` format as ``0.00250``. Any exponent suffix is kept.
+
+    Args:
+        formatted: Number already formatted as text
+
+    Returns:
+        Text without trailing fractional zeros or a dangling decimal point
+    """
+    mantissa, sep, exponent = formatted.partition("e")
+    if "." in mantissa:
+        mantissa = mantissa.rstrip("0").rstrip(".")
+    # Zero carries no meaningful exponent (0e-57) or sign (-0)
+    if mantissa in ("0", "-0"):
+        return "0"
+    return f"{mantissa}{sep}{exponent}"
+
+
 def format_numeric_result(result, precision: int = 9) -> str:
     """
     Format numerical result with intelligent precision.
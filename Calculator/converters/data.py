@@ -12,13 +12,15 @@ Unit groups:
 - IEC bits/bytes: Ki/Mi/Gi/Ti/Pi/Ei/Zi/Yi (base 1024)
 """
 
-from decimal import Decimal
+import sys
+from decimal import Decimal, localcontext
+from functools import lru_cache
 from enum import IntEnum
+from types import MappingProxyType
 
 from calculator.converters.base import BaseConverter
-from calculator.converters.converter_utils import to_decimal
+from calculator.converters.converter_utils import strip_trailing_zeros, to_decimal
 from calculator.config import DATA_HISTORY_FILE
-from calculator.exceptions import CalculatorError
 
 class DataUnit(IntEnum):
     """Data unit types - 35 units total."""
@@ -73,58 +75,135 @@ HISTORY_FILE = DATA_HISTORY_FILE
 # Menu Display Functions
 # ============================================================================
 
+_DATA_MENU = "\n".join([
+    "",
+    "=" * 60,
+    "           DATA UNIT CONVERSION MENU",
+    "=" * 60,
+    "",
+    "BASE UNITS:",
+    "  1.  Bit (b)",
+    "  2.  Nibble (4 bits)",
+    "  3.  Byte (B)",
+    "",
+    "DECIMAL BITS (SI - Base 1000):",
+    "  4.  Kilobit (kb)",
+    "  6.  Megabit (Mb)",
+    "  8.  Gigabit (Gb)",
+    "  10. Terabit (Tb)",
+    "  12. Petabit (Pb)",
+    "  14. Exabit (Eb)",
+    "  16. Zettabit (Zb)",
+    "  18. Yottabit (Yb)",
+    "",
+    "BINARY BITS (IEC - Base 1024):",
+    "  5.  Kibibit (Kib)",
+    "  7.  Mebibit (Mib)",
+    "  9.  Gibibit (Gib)",
+    "  11. Tebibit (Tib)",
+    "  13. Pebibit (Pib)",
+    "  15. Exbibit (Eib)",
+    "  17. Zebibit (Zib)",
+    "  19. Yobibit (Yib)",
+    "",
+    "DECIMAL BYTES (SI - Base 1000):",
+    "  20. Kilobyte (KB)",
+    "  22. Megabyte (MB)",
+    "  24. Gigabyte (GB)",
+    "  26. Terabyte (TB)",
+    "  28. Petabyte (PB)",
+    "  30. Exabyte (EB)",
+    "  32. Zettabyte (ZB)",
+    "  34. Yottabyte (YB)",
+    "",
+    "BINARY BYTES (IEC - Base 1024):",
+    "  21. Kibibyte (KiB)",
+    "  23. Mebibyte (MiB)",
+    "  25. Gibibyte (GiB)",
+    "  27. Tebibyte (TiB)",
+    "  29. Pebibyte (PiB)",
+    "  31. Exbibyte (EiB)",
+    "  33. Zebibyte (ZiB)",
+    "  35. Yobibyte (YiB)",
+    "",
+    "  36. Quit Data Converter",
+    "=" * 60,
+    "",
+])
+
+
 def data_converter_menuMsg() -> None:
     """Display comprehensive data unit conversion menu."""
-    print("\n" + "="*60)
-    print("           DATA UNIT CONVERSION MENU")
-    print("="*60)
-    print("\nBASE UNITS:")
-    print("  1.  Bit (b)")
-    print("  2.  Nibble (4 bits)")
-    print("  3.  Byte (B)")
-    
-    print("\nDECIMAL BITS (SI - Base 1000):")
-    print("  4.  Kilobit (kb)")
-    print("  6.  Megabit (Mb)")
-    print("  8.  Gigabit (Gb)")
-    print("  10. Terabit (Tb)")
-    print("  12. Petabit (Pb)")
-    print("  14. Exabit (Eb)")
-    print("  16. Zettabit (Zb)")
-    print("  18. Yottabit (Yb)")
+    sys.stdout.write(_DATA_MENU)
+
+
+# ============================================================================
+# Conversion Factor Tables
+# ============================================================================
+
+# Bits per unit (bit is the base unit).
+TO_BITS_FACTORS = MappingProxyType({
+    # Base units
+    DataUnit.BIT: Decimal("1"),
+    DataUnit.NIBBLE: Decimal("4"),
+    DataUnit.BYTE: Decimal("8"),
     
-    print("\nBINARY BITS (IEC - Base 1024):")
-    print("  5.  Kibibit (Kib)")
-    print("  7.  Mebibit (Mib)")
-    print("  9.  Gibibit (Gib)")
-    print("  11. Tebibit (Tib)")
-    print("  13. Pebibit (Pib)")
-    print("  15. Exbibit (Eib)")
-    print("  17. Zebibit (Zib)")
-    print("  19. Yobibit (Yib)")
+    # Decimal bits (SI - base 1000)
+    DataUnit.KILOBIT: Decimal("1000"),                # 10^3
+    DataUnit.MEGABIT: Decimal("1000000"),             # 10^6
+    DataUnit.GIGABIT: Decimal("1000000000"),          # 10^9
+    DataUnit.TERABIT: Decimal("1000000000000"),       # 10^12
+    DataUnit.PETABIT: Decimal("1000000000000000"),    # 10^15
+    DataUnit.EXABIT: Decimal("1e18"),                 # 10^18
+    DataUnit.ZETTABIT: Decimal("1e21"),               # 10^21
+    DataUnit.YOTTABIT: Decimal("1e24"),               # 10^24
     
-    print("\nDECIMAL BYTES (SI - Base 1000):")
-    print("  20. Kilobyte (KB)")
-    print("  22. Megabyte (MB)")
-    print("  24. Gigabyte (GB)")
-    print("  26. Terabyte (TB)")
-    print("  28. Petabyte (PB)")
-    print("  30. Exabyte (EB)")
-    print("  32. Zettabyte (ZB)")
-    print("  34. Yottabyte (YB)")
+    # Binary bits (IEC - base 1024)
+    DataUnit.KIBIBIT: Decimal(2) ** 10,              # 2^10
+    DataUnit.MEBIBIT: Decimal(2) ** 20,              # 2^20
+    DataUnit.GIBIBIT: Decimal(2) ** 30,              # 2^30
+    DataUnit.TEBIBIT: Decimal(2) ** 40,              # 2^40
+    DataUnit.PEBIBIT: Decimal(2) ** 50,              # 2^50
+    DataUnit.EXBIBIT: Decimal(2) ** 60,              # 2^60
+    DataUnit.ZEBIBIT: Decimal(2) ** 70,              # 2^70
+    DataUnit.YOBIBIT: Decimal(2) ** 80,              # 2^80
     
-    print("\nBINARY BYTES (IEC - Base 1024):")
-    print("  21. Kibibyte (KiB)")
-    print("  23. Mebibyte (MiB)")
-    print("  25. Gibibyte (GiB)")
-    print("  27. Tebibyte (TiB)")
-    print("  29. Pebibyte (PiB)")
-    print("  31. Exbibyte (EiB)")
-    print("  33. Zebibyte (ZiB)")
-    print("  35. Yobibyte (YiB)")
+    # Decimal bytes (SI - base 1000, x8 for bytes)
+    DataUnit.KILOBYTE: Decimal("8000"),                # 1000 x 8
+    DataUnit.MEGABYTE: Decimal("8000000"),             # 10^6 x 8
+    DataUnit.GIGABYTE: Decimal("8000000000"),          # 10^9 x 8
+    DataUnit.TERABYTE: Decimal("8000000000000"),       # 10^12 x 8
+    DataUnit.PETABYTE: Decimal("8000000000000000"),    # 10^15 x 8
+    DataUnit.EXABYTE: Decimal("8e18"),                 # 10^18 x 8
+    DataUnit.ZETTABYTE: Decimal("8e21"),               # 10^21 x 8
+    DataUnit.YOTTABYTE: Decimal("8e24"),               # 10^24 x 8
     
-    print("\n  36. Quit Data Converter")
-    print("="*60)
+    # Binary bytes (IEC - base 1024, x8 for bytes)
+    DataUnit.KIBIBYTE: Decimal(2) ** 10 * Decimal(8),  # 1024 x 8
+    DataUnit.MEBIBYTE: Decimal(2) ** 20 * Decimal(8),  # 2^20 x 8
+    DataUnit.GIBIBYTE: Decimal(2) ** 30 * Decimal(8),  # 2^30 x 8
+    DataUnit.TEBIBYTE: Decimal(2) ** 40 * Decimal(8),  # 2^40 x 8
+    DataUnit.PEBIBYTE: Decimal(2) ** 50 * Decimal(8),  # 2^50 x 8
+    DataUnit.EXBIBYTE: Decimal(2) ** 60 * Decimal(8),  # 2^60 x 8
+    DataUnit.ZEBIBYTE: Decimal(2) ** 70 * Decimal(8),  # 2^70 x 8
+    DataUnit.YOBIBYTE: Decimal(2) ** 80 * Decimal(8),  # 2^80 x 8
+})
+
+# Units per bit, so the bits -> target step is a multiply. Every factor is
+# 2^a * 10^b, whose reciprocal is exact at 60 significant digits.
+with localcontext() as _ctx:
+    _ctx.prec = 60
+    FROM_BITS_FACTORS = MappingProxyType({
+        unit: 1 / factor for unit, factor in TO_BITS_FACTORS.items()
+    })
+
+
+@lru_cache(maxsize=None)
+def _data_factor(from_unit: int, to_unit: int) -> Decimal:
+    """Return the exact from_unit -> to_unit factor, computed once per pair."""
+    with localcontext() as ctx:
+        ctx.prec = 60
+        return TO_BITS_FACTORS[from_unit] * FROM_BITS_FACTORS[to_unit]
 
 
 # ============================================================================
@@ -196,61 +275,9 @@ def convert_data(value, from_unit: int, to_unit: int) -> Decimal:
         >>> convert_data(1, DataUnit.KIBIBYTE, DataUnit.BYTE)
         1024.0
     """
-    # Conversion factors: Each unit -> bits
-    to_bits_factors = {
-        # Base units
-        DataUnit.BIT: Decimal("1"),
-        DataUnit.NIBBLE: Decimal("4"),
-        DataUnit.BYTE: Decimal("8"),
-        
-        # Decimal bits (SI - base 1000)
-        DataUnit.KILOBIT: Decimal("1000"),                # 10^3
-        DataUnit.MEGABIT: Decimal("1000000"),             # 10^6
-        DataUnit.GIGABIT: Decimal("1000000000"),          # 10^9
-        DataUnit.TERABIT: Decimal("1000000000000"),       # 10^12
-        DataUnit.PETABIT: Decimal("1000000000000000"),    # 10^15
-        DataUnit.EXABIT: Decimal("1e18"),                 # 10^18
-        DataUnit.ZETTABIT: Decimal("1e21"),               # 10^21
-        DataUnit.YOTTABIT: Decimal("1e24"),               # 10^24
-        
-        # Binary bits (IEC - base 1024)
-        DataUnit.KIBIBIT: Decimal(2) ** 10,              # 2^10
-        DataUnit.MEBIBIT: Decimal(2) ** 20,              # 2^20
-        DataUnit.GIBIBIT: Decimal(2) ** 30,              # 2^30
-        DataUnit.TEBIBIT: Decimal(2) ** 40,              # 2^40
-        DataUnit.PEBIBIT: Decimal(2) ** 50,              # 2^50
-        DataUnit.EXBIBIT: Decimal(2) ** 60,              # 2^60
-        DataUnit.ZEBIBIT: Decimal(2) ** 70,              # 2^70
-        DataUnit.YOBIBIT: Decimal(2) ** 80,              # 2^80
-        
-        # Decimal bytes (SI - base 1000, x8 for bytes)
-        DataUnit.KILOBYTE: Decimal("8000"),                # 1000 x 8
-        DataUnit.MEGABYTE: Decimal("8000000"),             # 10^6 x 8
-        DataUnit.GIGABYTE: Decimal("8000000000"),          # 10^9 x 8
-        DataUnit.TERABYTE: Decimal("8000000000000"),       # 10^12 x 8
-        DataUnit.PETABYTE: Decimal("8000000000000000"),    # 10^15 x 8
-        DataUnit.EXABYTE: Decimal("8e18"),                 # 10^18 x 8
-        DataUnit.ZETTABYTE: Decimal("8e21"),               # 10^21 x 8
-        DataUnit.YOTTABYTE: Decimal("8e24"),               # 10^24 x 8
-        
-        # Binary bytes (IEC - base 1024, x8 for bytes)
-        DataUnit.KIBIBYTE: Decimal(2) ** 10 * Decimal(8),  # 1024 x 8
-        DataUnit.MEBIBYTE: Decimal(2) ** 20 * Decimal(8),  # 2^20 x 8
-        DataUnit.GIBIBYTE: Decimal(2) ** 30 * Decimal(8),  # 2^30 x 8
-        DataUnit.TEBIBYTE: Decimal(2) ** 40 * Decimal(8),  # 2^40 x 8
-        DataUnit.PEBIBYTE: Decimal(2) ** 50 * Decimal(8),  # 2^50 x 8
-        DataUnit.EXBIBYTE: Decimal(2) ** 60 * Decimal(8),  # 2^60 x 8
-        DataUnit.ZEBIBYTE: Decimal(2) ** 70 * Decimal(8),  # 2^70 x 8
-        DataUnit.YOBIBYTE: Decimal(2) ** 80 * Decimal(8),  # 2^80 x 8
-    }
-    
-    # Step 1: Convert input value to bits (base unit)
-    data_in_bits = to_decimal(value, "Data") * to_bits_factors[from_unit]
-    
-    # Step 2: Convert bits to target unit
-    result = data_in_bits / to_bits_factors[to_unit]
-    
-    return result
+    # Both steps are folded into one cached factor per (from, to) pair;
+    # int() keys let IntEnum members and plain ints share cache entries.
+    return to_decimal(value, "Data") * _data_factor(int(from_unit), int(to_unit))
 
 
 # ============================================================================
@@ -376,7 +403,7 @@ def format_data_result(result) -> str:
         return format(result_dec, ".6E").lower()
     if abs_val >= Decimal("1000"):
         return format(result_dec, ".2f")
-    return format(result_dec, ".9g")
+    return strip_trailing_zeros(format(result_dec, ".9g"))
 
 
 # ============================================================================
@@ -418,10 +445,7 @@ def data_converter() -> None:
     Main data unit conversion interface.
     Provides interactive menu for data conversions.
     """
-    try:
-        DataConverter().run()
-    except (CalculatorError):
-        raise
+    DataConverter().run()
 
 # ============================================================================
 # Main Entry Point
@@ -7,13 +7,14 @@ Features:
 - Shared BaseConverter UI and history handling.
 """
 
+import sys
 from decimal import Decimal
 from enum import IntEnum
+from types import MappingProxyType
 
 from calculator.converters.base import BaseConverter
-from calculator.converters.converter_utils import to_decimal
+from calculator.converters.converter_utils import format_numeric_result, strip_trailing_zeros, to_decimal
 from calculator.config import PRESSURE_HISTORY_FILE
-from calculator.exceptions import CalculatorError
 
 
 class PressureUnit(IntEnum):
@@ -31,20 +32,55 @@ class PressureUnit(IntEnum):
 # Menu Display Functions
 # ============================================================================
 
+_PRESSURE_MENU = "\n".join([
+    "",
+    "=" * 50,
+    "PRESSURE CONVERSION",
+    "=" * 50,
+    "",
+    "PRESSURE UNITS:",
+    "  1. Atmosphere (atm)",
+    "  2. Bar (bar)",
+    "  3. Kilopascal (kPa)",
+    "  4. Millimeter of Mercury (mmHg)",
+    "  5. Pascal (Pa)",
+    "  6. Pounds per Square Inch (psi)",
+    "",
+    "  7. Quit Pressure Converter",
+    "=" * 50,
+    "",
+])
+
+
 def pressure_conv_menuMsg() -> None:
     """Display pressure conversion menu with all 6 units."""
-    print("\n" + "="*50)
-    print("PRESSURE CONVERSION")
-    print("="*50)
-    print("\nPRESSURE UNITS:")
-    print("  1. Atmosphere (atm)")
-    print("  2. Bar (bar)")
-    print("  3. Kilopascal (kPa)")
-    print("  4. Millimeter of Mercury (mmHg)")
-    print("  5. Pascal (Pa)")
-    print("  6. Pounds per Square Inch (psi)")
-    print("\n  7. Quit Pressure Converter")
-    print("="*50)
+    sys.stdout.write(_PRESSURE_MENU)
+
+
+# ============================================================================
+# Conversion Factor Tables
+# ============================================================================
+
+# Pascals per unit (Pascal is the base unit).
+TO_PASCAL_FACTORS = MappingProxyType({
+    PressureUnit.ATMOSPHERE: Decimal("101325"),
+    PressureUnit.BAR: Decimal("100000"),
+    PressureUnit.KILOPASCAL: Decimal("1000"),
+    PressureUnit.MM_MERCURY: Decimal("133.322"),
+    PressureUnit.PASCAL: Decimal("1"),
+    PressureUnit.PSI: Decimal("6894.76"),
+})
+
+# Direct factor for every (from, to) pair: PRESSURE_FACTORS[from_unit][to_unit].
+# Keyed by plain ints: menu input arrives as int, which then hashes and
+# compares without going through PressureUnit members.
+PRESSURE_FACTORS = MappingProxyType({
+    int(from_unit): MappingProxyType({
+        int(to_unit): from_factor / to_factor
+        for to_unit, to_factor in TO_PASCAL_FACTORS.items()
+    })
+    for from_unit, from_factor in TO_PASCAL_FACTORS.items()
+})
 
 
 # ============================================================================
@@ -56,8 +92,8 @@ def convert_pressure(value: Decimal, from_unit: int, to_unit: int) -> Decimal:
     Universal pressure converter - converts any pressure unit to any other unit.
 
     Strategy:
-    1. Convert input value to Pascals (base unit)
-    2. Convert Pascals to target unit
+    The Pascal round-trip (value -> Pa -> target) is folded into a
+    precomputed per-pair factor, so each call is one lookup and one multiply.
 
     Args:
         value: Pressure value to convert
@@ -67,17 +103,7 @@ def convert_pressure(value: Decimal, from_unit: int, to_unit: int) -> Decimal:
     Returns:
         Converted pressure value as Decimal.
     """
-    to_pascal_factors = {
-        PressureUnit.ATMOSPHERE: Decimal("101325"),
-        PressureUnit.BAR: Decimal("100000"),
-        PressureUnit.KILOPASCAL: Decimal("1000"),
-        PressureUnit.MM_MERCURY: Decimal("133.322"),
-        PressureUnit.PASCAL: Decimal("1"),
-        PressureUnit.PSI: Decimal("6894.76"),
-    }
-
-    pressure_in_pa = to_decimal(value, "Pressure") * to_pascal_factors[from_unit]
-    return pressure_in_pa / to_pascal_factors[to_unit]
+    return to_decimal(value, "Pressure") * PRESSURE_FACTORS[from_unit][to_unit]
 
 
 # ============================================================================
@@ -120,6 +146,10 @@ class PressureConverter(BaseConverter):
     def convert(self, value: Decimal, from_unit: int, to_unit: int) -> Decimal:
         return convert_pressure(value, from_unit, to_unit)
 
+    def format_result(self, result: Decimal) -> str:
+        # Pair-factor products keep operand zeros the old division dropped.
+        return strip_trailing_zeros(format_numeric_result(result))
+
     def display_menu(self) -> None:
         pressure_conv_menuMsg()
 
@@ -138,9 +168,6 @@ def clear_hist_pressure_conv() -> None:
 
 def pressure_converter() -> None:
     """Main pressure conversion interface."""
-    try:
-        PressureConverter().run()
-    except (CalculatorError):
-        raise
+    PressureConverter().run()
 
 
@@ -7,14 +7,14 @@ Features:
 - Shared BaseConverter UI and history handling.
 """
 
-from decimal import Decimal
+import sys
+from decimal import Decimal, localcontext
 from enum import IntEnum
 from typing import Callable, Dict, Tuple
 
 from calculator.converters.base import BaseConverter
 from calculator.converters.converter_utils import to_decimal
 from calculator.config import TEMP_HISTORY_FILE
-from calculator.exceptions import CalculatorError
 
 class TempUnit(IntEnum):
     """Temperature unit types."""
@@ -28,50 +28,135 @@ class TempUnit(IntEnum):
 # Menu Display Functions
 # ============================================================================
 
+_TEMP_MENU = "\n".join([
+    "",
+    "=" * 50,
+    "TEMPERATURE CONVERSION",
+    "=" * 50,
+    "1. Celsius (°C)",
+    "2. Kelvin (K)",
+    "3. Fahrenheit (°F)",
+    "4. Quit Temperature Converter",
+    "=" * 50,
+    "",
+])
+
+
 def temp_conv_menuMsg() -> None:
     """Display temperature conversion menu."""
-    print("\n" + "="*50)
-    print("TEMPERATURE CONVERSION")
-    print("="*50)
-    print("1. Celsius (°C)")
-    print("2. Kelvin (K)")
-    print("3. Fahrenheit (°F)")
-    print("4. Quit Temperature Converter")
-    print("="*50)
+    sys.stdout.write(_TEMP_MENU)
 
 
 # ============================================================================
 # Temperature Conversion Functions (pure Decimal)
 # ============================================================================
 
+# Every temperature conversion is affine: out = value * scale + offset.
+# 5/9 has no exact Decimal form, so the Fahrenheit factors are held at 60
+# digits and each converter rounds once, back to the caller's context.
+with localcontext() as _ctx:
+    _ctx.prec = 60
+    _FIVE_NINTHS = Decimal(5) / Decimal(9)
+    TEMP_AFFINE_FACTORS: Dict[Tuple[int, int], Tuple[Decimal, Decimal]] = {
+        (TempUnit.CELSIUS, TempUnit.KELVIN): (Decimal(1), Decimal("273.15")),
+        (TempUnit.CELSIUS, TempUnit.FAHRENHEIT): (Decimal("1.8"), Decimal(32)),
+        (TempUnit.KELVIN, TempUnit.CELSIUS): (Decimal(1), Decimal("-273.15")),
+        (TempUnit.KELVIN, TempUnit.FAHRENHEIT): (Decimal("1.8"), Decimal("-459.67")),
+        (TempUnit.FAHRENHEIT, TempUnit.CELSIUS): (_FIVE_NINTHS, -32 * _FIVE_NINTHS),
+        (TempUnit.FAHRENHEIT, TempUnit.KELVIN): (
+            _FIVE_NINTHS, Decimal("273.15") - 32 * _FIVE_NINTHS
+        ),
+    }
+
+
+def _make_affine(scale: Decimal, offset: Decimal) -> Callable[[Decimal], Decimal]:
+    """Build a converter with scale and offset bound as closure constants."""
+    def convert(tmp: Decimal) -> Decimal:
+        value = to_decimal(tmp, "Temperature")
+        with localcontext() as ctx:
+            ctx.prec = 60
+            result = value * scale + offset
+        # Round once, back to the caller's context
+        return +result
+    return convert
+
+
+# One specialized converter per (from, to) pair, built once at import.
+TEMP_CONVERTERS: Dict[Tuple[int, int], Callable[[Decimal], Decimal]] = {
+    key: _make_affine(scale, offset)
+    for key, (scale, offset) in TEMP_AFFINE_FACTORS.items()
+}
+
+_TEMP_UNIT_COUNT = 3
+
+# Flat dispatch table: slot (from - 1) * 3 + (to - 1), None for same-unit pairs.
+_TEMP_CONVERTER_TABLE: Tuple[Callable[[Decimal], Decimal] | None, ...] = tuple(
+    TEMP_CONVERTERS.get((from_unit, to_unit))
+    for from_unit in range(1, _TEMP_UNIT_COUNT + 1)
+    for to_unit in range(1, _TEMP_UNIT_COUNT + 1)
+)
+
+
+# Resolved once so the named functions skip the enum attribute and dict lookups.
+_C_TO_K = TEMP_CONVERTERS[(TempUnit.CELSIUS, TempUnit.KELVIN)]
+_C_TO_F = TEMP_CONVERTERS[(TempUnit.CELSIUS, TempUnit.FAHRENHEIT)]
+_K_TO_C = TEMP_CONVERTERS[(TempUnit.KELVIN, TempUnit.CELSIUS)]
+_K_TO_F = TEMP_CONVERTERS[(TempUnit.KELVIN, TempUnit.FAHRENHEIT)]
+_F_TO_C = TEMP_CONVERTERS[(TempUnit.FAHRENHEIT, TempUnit.CELSIUS)]
+_F_TO_K = TEMP_CONVERTERS[(TempUnit.FAHRENHEIT, TempUnit.KELVIN)]
+
+
 def C_to_kelvin(tmp: Decimal) -> Decimal:
     """Convert Celsius to Kelvin."""
-    return to_decimal(tmp, "Temperature") + Decimal("273.15")
+    return _C_TO_K(tmp)
 
 
 def C_to_Fahrenheit(tmp: Decimal) -> Decimal:
     """Convert Celsius to Fahrenheit."""
-    return (to_decimal(tmp, "Temperature") * Decimal(9) / Decimal(5)) + Decimal(32)
+    return _C_TO_F(tmp)
 
 
 def K_to_celsius(tmp: Decimal) -> Decimal:
     """Convert Kelvin to Celsius."""
-    return to_decimal(tmp, "Temperature") - Decimal("273.15")
+    return _K_TO_C(tmp)
 
 
 def K_to_Fahrenheit(tmp: Decimal) -> Decimal:
     """Convert Kelvin to Fahrenheit."""
-    return C_to_Fahrenheit(K_to_celsius(tmp))
+    return _K_TO_F(tmp)
 
 
 def F_to_celsius(tmp: Decimal) -> Decimal:
     """Convert Fahrenheit to Celsius."""
-    return (to_decimal(tmp, "Temperature") - Decimal(32)) * Decimal(5) / Decimal(9)
+    return _F_TO_C(tmp)
 
 
 def F_to_kelvin(tmp: Decimal) -> Decimal:
     """Convert Fahrenheit to Kelvin."""
-    return F_to_celsius(tmp) + Decimal("273.15")
+    return _F_TO_K(tmp)
+
+
+def convert_temperature(value: Decimal, from_unit: int, to_unit: int) -> Decimal:
+    """
+    Universal temperature converter - converts between any two distinct units.
+
+    Args:
+        value: Temperature value to convert
+        from_unit: Source unit (TempUnit enum value)
+        to_unit: Target unit (TempUnit enum value)
+
+    Returns:
+        Converted temperature as Decimal.
+
+    Raises:
+        KeyError: If the pair is not a conversion between two known units.
+    """
+    convert = None
+    if 1 <= from_unit <= _TEMP_UNIT_COUNT and 1 <= to_unit <= _TEMP_UNIT_COUNT:
+        convert = _TEMP_CONVERTER_TABLE[(from_unit - 1) * _TEMP_UNIT_COUNT + (to_unit - 1)]
+    if convert is None:
+        raise KeyError("Invalid temperature conversion.")
+    return convert(value)
 
 
 # ============================================================================
@@ -108,11 +193,7 @@ class TemperatureConverter(BaseConverter):
     }
 
     def convert(self, value: Decimal, from_unit: int, to_unit: int) -> Decimal:
-        key = (from_unit, to_unit)
-        if key not in temp_conv_funcs:
-            raise KeyError("Invalid temperature conversion.")
-        _, _, func = temp_conv_funcs[key]
-        return func(value)
+        return convert_temperature(value, from_unit, to_unit)
 
     def display_menu(self) -> None:
         temp_conv_menuMsg()
@@ -132,9 +213,6 @@ def clear_hist_temp_conv() -> None:
 
 def temperature_converter() -> None:
     """Main temperature conversion interface."""
-    try:
-        TemperatureConverter().run()
-    except (CalculatorError):
-        raise
+    TemperatureConverter().run()
 
 
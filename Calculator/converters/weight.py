@@ -7,13 +7,14 @@ Features:
 - Shared BaseConverter UI and history handling.
 """
 
+import sys
 from decimal import Decimal
 from enum import IntEnum
+from types import MappingProxyType
 
 from calculator.converters.base import BaseConverter
-from calculator.converters.converter_utils import to_decimal
+from calculator.converters.converter_utils import format_numeric_result, strip_trailing_zeros, to_decimal
 from calculator.config import WEIGHT_HISTORY_FILE
-from calculator.exceptions import CalculatorError
 
 class WeightUnit(IntEnum):
     """Weight unit types - 13 units total."""
@@ -37,28 +38,71 @@ class WeightUnit(IntEnum):
 # Menu Display Functions
 # ============================================================================
 
+_WEIGHT_MENU = "\n".join([
+    "",
+    "=" * 50,
+    "WEIGHT CONVERSION",
+    "=" * 50,
+    "",
+    "METRIC UNITS:",
+    "  1.  Kilogram (kg)",
+    "  2.  Gram (g)",
+    "  3.  Milligram (mg)",
+    "  4.  Centigram (cg)",
+    "  5.  Decigram (dg)",
+    "  6.  Decagram (dag)",
+    "  7.  Hectogram (hg)",
+    "  8.  Metric Tonne (t)",
+    "",
+    "IMPERIAL/US UNITS:",
+    "  9.  Ounce (oz)",
+    "  10. Pound (lb)",
+    "  11. Stone (st)",
+    "  12. Short Ton - US (ton)",
+    "  13. Long Ton - UK (ton)",
+    "",
+    "  14. Quit Weight Converter",
+    "=" * 50,
+    "",
+])
+
+
 def weight_conv_menuMsg() -> None:
     """Display weight conversion menu with all 13 units."""
-    print("\n" + "="*50)
-    print("WEIGHT CONVERSION")
-    print("="*50)
-    print("\nMETRIC UNITS:")
-    print("  1.  Kilogram (kg)")
-    print("  2.  Gram (g)")
-    print("  3.  Milligram (mg)")
-    print("  4.  Centigram (cg)")
-    print("  5.  Decigram (dg)")
-    print("  6.  Decagram (dag)")
-    print("  7.  Hectogram (hg)")
-    print("  8.  Metric Tonne (t)")
-    print("\nIMPERIAL/US UNITS:")
-    print("  9.  Ounce (oz)")
-    print("  10. Pound (lb)")
-    print("  11. Stone (st)")
-    print("  12. Short Ton - US (ton)")
-    print("  13. Long Ton - UK (ton)")
-    print("\n  14. Quit Weight Converter")
-    print("="*50)
+    sys.stdout.write(_WEIGHT_MENU)
+
+
+# ============================================================================
+# Conversion Factor Tables
+# ============================================================================
+
+# Kilograms per unit (kilogram is the base unit).
+TO_KG_FACTORS = MappingProxyType({
+    WeightUnit.KILOGRAM: Decimal("1"),
+    WeightUnit.GRAM: Decimal("0.001"),
+    WeightUnit.MILLIGRAM: Decimal("0.000001"),
+    WeightUnit.CENTIGRAM: Decimal("0.00001"),
+    WeightUnit.DECIGRAM: Decimal("0.0001"),
+    WeightUnit.DECAGRAM: Decimal("0.01"),
+    WeightUnit.HECTOGRAM: Decimal("0.1"),
+    WeightUnit.METRIC_TONNE: Decimal("1000"),
+    WeightUnit.OUNCE: Decimal("0.0283495"),
+    WeightUnit.POUND: Decimal("0.453592"),
+    WeightUnit.STONE: Decimal("6.35029"),
+    WeightUnit.SHORT_TON_US: Decimal("907.185"),
+    WeightUnit.LONG_TON_UK: Decimal("1016.05"),
+})
+
+# Direct factor for every (from, to) pair: WEIGHT_FACTORS[from_unit][to_unit].
+# Keyed by plain ints: menu input arrives as int, which then hashes and
+# compares without going through WeightUnit members.
+WEIGHT_FACTORS = MappingProxyType({
+    int(from_unit): MappingProxyType({
+        int(to_unit): from_factor / to_factor
+        for to_unit, to_factor in TO_KG_FACTORS.items()
+    })
+    for from_unit, from_factor in TO_KG_FACTORS.items()
+})
 
 
 # ============================================================================
@@ -70,8 +114,8 @@ def convert_weight(value: Decimal, from_unit: int, to_unit: int) -> Decimal:
     Universal weight converter - converts any weight unit to any other unit.
 
     Strategy:
-    1. Convert input value to kilograms (base unit)
-    2. Convert kilograms to target unit
+    The kilogram round-trip (value -> kg -> target) is folded into a
+    precomputed per-pair factor, so each call is one lookup and one multiply.
 
     Args:
         value: Weight value to convert
@@ -81,24 +125,7 @@ def convert_weight(value: Decimal, from_unit: int, to_unit: int) -> Decimal:
     Returns:
         Converted weight value as Decimal.
     """
-    to_kg_factors = {
-        WeightUnit.KILOGRAM: Decimal("1"),
-        WeightUnit.GRAM: Decimal("0.001"),
-        WeightUnit.MILLIGRAM: Decimal("0.000001"),
-        WeightUnit.CENTIGRAM: Decimal("0.00001"),
-        WeightUnit.DECIGRAM: Decimal("0.0001"),
-        WeightUnit.DECAGRAM: Decimal("0.01"),
-        WeightUnit.HECTOGRAM: Decimal("0.1"),
-        WeightUnit.METRIC_TONNE: Decimal("1000"),
-        WeightUnit.OUNCE: Decimal("0.0283495"),
-        WeightUnit.POUND: Decimal("0.453592"),
-        WeightUnit.STONE: Decimal("6.35029"),
-        WeightUnit.SHORT_TON_US: Decimal("907.185"),
-        WeightUnit.LONG_TON_UK: Decimal("1016.05"),
-    }
-
-    weight_in_kg = to_decimal(value, "Weight") * to_kg_factors[from_unit]
-    return weight_in_kg / to_kg_factors[to_unit]
+    return to_decimal(value, "Weight") * WEIGHT_FACTORS[from_unit][to_unit]
 
 
 # ============================================================================
@@ -155,6 +182,10 @@ class WeightConverter(BaseConverter):
     def convert(self, value: Decimal, from_unit: int, to_unit: int) -> Decimal:
         return convert_weight(value, from_unit, to_unit)
 
+    def format_result(self, result: Decimal) -> str:
+        # Pair-factor products keep operand zeros the old division dropped.
+        return strip_trailing_zeros(format_numeric_result(result))
+
     def display_menu(self) -> None:
         weight_conv_menuMsg()
 
@@ -173,9 +204,6 @@ def clear_hist_weight_conv() -> None:
 
 def weight_converter() -> None:
     """Main weight conversion interface."""
-    try:
-        WeightConverter().run()
-    except (CalculatorError):
-        raise
+    WeightConverter().run()
 
 
@@ -9,15 +9,15 @@ from pathlib import Path
 import tkinter as tk
 from tkinter import scrolledtext, ttk
 
-from config import SCI_HISTORY_FILE, STD_HISTORY_FILE
-from converters.angle import AngleConverter
-from converters.base import BaseConverter
-from converters.data import DataConverter
-from converters.pressure import PressureConverter
-from converters.temperature import TemperatureConverter
-from converters.weight import WeightConverter
-from exceptions import CalculatorError
-from programmer import (
+from calculator.config import SCI_HISTORY_FILE, STD_HISTORY_FILE
+from calculator.converters.angle import AngleConverter
+from calculator.converters.base import BaseConverter
+from calculator.converters.data import DataConverter
+from calculator.converters.pressure import PressureConverter
+from calculator.converters.temperature import TemperatureConverter
+from calculator.converters.weight import WeightConverter
+from calculator.exceptions import CalculatorError
+from calculator.programmer import (
     WORD_SIZE_LABELS,
     WordSize,
     _parse_int,
@@ -43,9 +43,9 @@ from programmer import (
     shift_logical_right,
     show_all_bases_map,
 )
-from scientific import trigo_funcs, validate_and_eval
-from scientific_parts.core import FunctionCategory
-from standard import compute_expression
+from calculator.scientific import flush_hist_sci_calc, trigo_funcs, trigo_key, validate_and_eval
+from calculator.scientific_parts.core import FunctionCategory
+from calculator.standard import compute_expression, flush_hist_std_calc
 
 
 PALETTE = {
@@ -387,9 +387,11 @@ class StandardPanel(tk.Frame):
         self.refresh_history()
 
     def refresh_history(self) -> None:
+        flush_hist_std_calc()
         set_text(self.history_text, read_history(STD_HISTORY_FILE, "No standard-calculator history yet."))
 
     def clear_history(self) -> None:
+        flush_hist_std_calc()
         clear_history(STD_HISTORY_FILE)
         self.feedback_var.set("Standard history cleared.")
         self.refresh_history()
@@ -554,7 +556,7 @@ class ScientificPanel(tk.Frame):
 
     def _sync_function_buttons(self) -> None:
         for index, button in enumerate(self.function_buttons, start=1):
-            name, _func = trigo_funcs[(self.current_category.op_num, index)]
+            name, _func = trigo_funcs[trigo_key(self.current_category.op_num, index)]
             selected = index == self.current_suboperation
             bg = PALETTE["secondary"] if selected else PALETTE["card_alt"]
             fg = PALETTE["white"] if selected else PALETTE["text"]
@@ -575,7 +577,7 @@ class ScientificPanel(tk.Frame):
             self.result_var.set(str(exc))
             return
 
-        name, func = trigo_funcs[(self.current_category.op_num, self.current_suboperation)]
+        name, func = trigo_funcs[trigo_key(self.current_category.op_num, self.current_suboperation)]
         self.result_var.set(
             validate_and_eval(
                 self.current_category.op_num,
@@ -592,9 +594,11 @@ class ScientificPanel(tk.Frame):
         self.result_var.set("Choose a function, enter a value, and calculate.")
 
     def refresh_history(self) -> None:
+        flush_hist_sci_calc()
         set_text(self.history_text, read_history(SCI_HISTORY_FILE, "No scientific history yet."))
 
     def clear_history(self) -> None:
+        flush_hist_sci_calc()
         clear_history(SCI_HISTORY_FILE)
         self.result_var.set("Scientific history cleared.")
         self.refresh_history()
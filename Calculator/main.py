@@ -5,6 +5,7 @@ Desktop-first calculator entry point with a CLI fallback.
 """
 
 import argparse
+import sys
 from enum import IntEnum
 
 from calculator.standard import (
@@ -17,6 +18,7 @@ from calculator.scientific import (
 )
 from calculator.router import converter_menu
 from calculator.programmer import programmer_calc
+from calculator.utils import read_menu_choice
 
 
 class MainMode(IntEnum):
@@ -32,17 +34,24 @@ class MainMode(IntEnum):
 # Menu Display Functions
 # ============================================================================
 
+_MODE_MENU = "\n".join([
+    "",
+    "=" * 50,
+    "ADVANCED MODULAR CALCULATOR",
+    "=" * 50,
+    "1. Standard Calculator",
+    "2. Scientific Calculator",
+    "3. Unit Converter",
+    "4. Programmer Calculator",
+    "5. Quit Calculator",
+    "=" * 50,
+    "",
+])
+
+
 def mode_choice_menu() -> None:
     """Display main menu options."""
-    print("\n" + "="*50)
-    print("ADVANCED MODULAR CALCULATOR")
-    print("="*50)
-    print("1. Standard Calculator")
-    print("2. Scientific Calculator")
-    print("3. Unit Converter")
-    print("4. Programmer Calculator")
-    print("5. Quit Calculator")
-    print("="*50)
+    sys.stdout.write(_MODE_MENU)
 
 
 # ============================================================================
@@ -58,9 +67,8 @@ def cli_main() -> None:
     try:
         while True:
             mode_choice_menu()
-            try:
-                mode_choice = int(input("\nSelect a mode: "))
-            except (ValueError, TypeError):
+            mode_choice = read_menu_choice("\nSelect a mode: ")
+            if mode_choice is None:
                 errmsg()
                 continue
 
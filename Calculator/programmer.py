@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from textwrap import dedent
 
 from calculator.exceptions import (
@@ -10,6 +11,7 @@ from calculator.exceptions import (
     InvalidBitShiftError,
     NullInputError,
 )
+from calculator.utils import read_menu_choice
 from calculator.programmer_parts.operations import (
     WORD_SIZE_CYCLE,
     WORD_SIZE_LABELS,
@@ -244,10 +246,8 @@ def prog_main_menu() -> None:
     )
 
 
-def base_conv_menu() -> None:
-    print(
-        dedent(
-            """
+_BASE_CONV_MENU = dedent(
+    """
         ──────────────────────────────────────────
         BASE CONVERSION  (enter any prefix or none)
           Decimal : plain digits, e.g. 255
@@ -261,14 +261,15 @@ def base_conv_menu() -> None:
         4.  OCT → DEC / HEX / BIN  (show all)
         5.  Back
         ──────────────────────────────────────────"""
-        )
-    )
+) + "\n"
 
 
-def bitwise_menu() -> None:
-    print(
-        dedent(
-            """
+def base_conv_menu() -> None:
+    sys.stdout.write(_BASE_CONV_MENU)
+
+
+_BITWISE_MENU = dedent(
+    """
         ──────────────────────────────────────────
         BITWISE OPERATIONS
         ──────────────────────────────────────────
@@ -281,14 +282,15 @@ def bitwise_menu() -> None:
         7.  XNOR  (~(A ^ B))
         8.  Back
         ──────────────────────────────────────────"""
-        )
-    )
+) + "\n"
 
 
-def shift_menu() -> None:
-    print(
-        dedent(
-            """
+def bitwise_menu() -> None:
+    sys.stdout.write(_BITWISE_MENU)
+
+
+_SHIFT_MENU = dedent(
+    """
         ──────────────────────────────────────────
         BIT SHIFT
         ──────────────────────────────────────────
@@ -302,8 +304,11 @@ def shift_menu() -> None:
         8.  Rotate Right + Carry   (RCR)
         9.  Back
         ──────────────────────────────────────────"""
-        )
-    )
+) + "\n"
+
+
+def shift_menu() -> None:
+    sys.stdout.write(_SHIFT_MENU)
 
 
 def _print_result(label: str, value: int) -> None:
@@ -315,9 +320,8 @@ def _print_result(label: str, value: int) -> None:
 def handle_base_conversion() -> None:
     while True:
         base_conv_menu()
-        try:
-            choice = int(input("Enter choice: "))
-        except (ValueError, TypeError):
+        choice = read_menu_choice("Enter choice: ")
+        if choice is None:
             print(InvalidInputError())
             continue
         if choice == 5:
@@ -361,9 +365,8 @@ def handle_base_conversion() -> None:
 def handle_bitwise() -> None:
     while True:
         bitwise_menu()
-        try:
-            choice = int(input("Enter choice: "))
-        except (ValueError, TypeError):
+        choice = read_menu_choice("Enter choice: ")
+        if choice is None:
             print(InvalidInputError())
             continue
         if choice == 8:
@@ -404,9 +407,8 @@ def handle_bitwise() -> None:
 def handle_bit_shift() -> None:
     while True:
         shift_menu()
-        try:
-            choice = int(input("Enter choice: "))
-        except (ValueError, TypeError):
+        choice = read_menu_choice("Enter choice: ")
+        if choice is None:
             print(InvalidInputError())
             continue
         if choice == 9:
@@ -425,7 +427,7 @@ def handle_bit_shift() -> None:
                 try:
                     carry_raw = int(input("Enter carry flag (0 or 1): ").strip())
                     carry = carry_raw & 1
-                except (ValueError, TypeError):
+                except ValueError:
                     print(InvalidInputError("\nInput Error: Carry must be 0 or 1.\n"))
                     continue
                 if choice == 7:
@@ -454,9 +456,8 @@ def handle_bit_shift() -> None:
 def programmer_calc() -> None:
     while True:
         prog_main_menu()
-        try:
-            choice = int(input("Enter choice: "))
-        except (ValueError, TypeError, KeyboardInterrupt):
+        choice = read_menu_choice("Enter choice: ")
+        if choice is None:
             print(InvalidInputError())
             continue
         try:
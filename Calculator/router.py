@@ -5,15 +5,16 @@ Provides angle, temperature, weight, pressure, and data conversion functionality
 Routes to specific converter modules.
 """
 
+import sys
 from enum import IntEnum
 
-from calculator.utils import errmsg
 from calculator.converters.angle import angle_converter
 from calculator.converters.temperature import temperature_converter
 from calculator.converters.weight import weight_converter
 from calculator.converters.pressure import pressure_converter
 from calculator.converters.data import data_converter
 from calculator.exceptions import CalculatorError
+from calculator.utils import read_menu_choice
 
 class MenuOptions(IntEnum):
     """Conversion unit types."""
@@ -29,46 +30,59 @@ class MenuOptions(IntEnum):
 # Menu Display Functions
 # ============================================================================
 
+_CONVERTER_MENU = "\n".join([
+    "",
+    "=" * 50,
+    "UNIT CONVERTER",
+    "=" * 50,
+    "1. Angle Conversion",
+    "2. Temperature Conversion",
+    "3. Weight Conversion",
+    "4. Pressure Conversion",
+    "5. Data Conversion",
+    "6. Quit Converter",
+    "=" * 50,
+    "",
+])
+
+
 def converter_menuMsg() -> None:
     """Display main converter menu."""
-    print("\n" + "="*50)
-    print("UNIT CONVERTER")
-    print("="*50)
-    print("1. Angle Conversion")
-    print("2. Temperature Conversion")
-    print("3. Weight Conversion")
-    print("4. Pressure Conversion")
-    print("5. Data Conversion")
-    print("6. Quit Converter")
-    print("="*50)
+    sys.stdout.write(_CONVERTER_MENU)
 
 
 # ============================================================================
 # Main Converter Function
 # ============================================================================
 
+# Converter entry points indexed by menu choice (slot 0 unused).
+_CONVERTER_DISPATCH = (
+    None,
+    angle_converter,        # MenuOptions.ANGLE_CONVERSION
+    temperature_converter,  # MenuOptions.TEMPERATURE_CONVERSION
+    weight_converter,       # MenuOptions.WEIGHT_CONVERSION
+    pressure_converter,     # MenuOptions.PRESSURE_CONVERSION
+    data_converter,         # MenuOptions.DATA_CONVERSION
+)
+
+
 def converter_menu() -> None:
     """Main converter interface. Routes to specific converter modules."""
     while True:
         
         converter_menuMsg()
         try:
-            op_num = int(input("\nEnter your choice: "))
-        
+            op_num = read_menu_choice("\nEnter your choice: ")
+            if op_num is None:
+                print("Invalid value: Please select 1-6\n")
+                continue
+
             if op_num == MenuOptions.QUIT:
                 print("\n   Converter menu closed\n")
                 break
 
-            if op_num == MenuOptions.ANGLE_CONVERSION:
-                angle_converter()
-            elif op_num == MenuOptions.TEMPERATURE_CONVERSION:
-                temperature_converter()
-            elif op_num == MenuOptions.WEIGHT_CONVERSION:
-                weight_converter()
-            elif op_num == MenuOptions.PRESSURE_CONVERSION:
-                pressure_converter()
-            elif op_num == MenuOptions.DATA_CONVERSION:
-                data_converter()
+            if 1 <= op_num < len(_CONVERTER_DISPATCH):
+                _CONVERTER_DISPATCH[op_num]()
             else:
                 print("Invalid choice: Please select 1-6\n")
 
@@ -9,6 +9,8 @@ Implementation is split across:
 """
 
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+import sys
 from textwrap import dedent
 from typing import Callable, Optional, Tuple
 
@@ -53,6 +55,7 @@ from calculator.scientific_parts.functions import (
 from calculator.scientific_parts.history import (
     clear_hist_sci_calc as _clear_history_impl,
     display_hist_sci_calc as _display_history_impl,
+    flush_hist_sci_calc as _flush_history_impl,
     record_history_sci_calc as _record_history_impl,
 )
 from calculator.scientific_parts.validators import (
@@ -61,6 +64,7 @@ from calculator.scientific_parts.validators import (
     validate_inverse_trig_domain as _validate_inverse_trig_domain,
     validate_trig_asymptote as _validate_trig_asymptote,
 )
+from calculator.utils import read_menu_choice
 
 HISTORY_FILE = SCI_HISTORY_FILE
 
@@ -85,11 +89,8 @@ def cot_inv(val: NumberLike) -> Decimal:
     return _cot_inv_impl(val_dec)
 
 
-def sci_calc_menuMsg() -> None:
-    """Display scientific calculator menu with all functions."""
-    print(
-        dedent(
-            """
+_SCI_MENU = dedent(
+    """
                 |============================>Operations<============================|\n
 
                 1. Basic trigo functions
@@ -130,8 +131,12 @@ def sci_calc_menuMsg() -> None:
                 8. Quit scientific calculator.
                 |====================================================================|
 """
-        )
-    )
+) + "\n"
+
+
+def sci_calc_menuMsg() -> None:
+    """Display scientific calculator menu with all functions."""
+    sys.stdout.write(_SCI_MENU)
 
 
 def get_val() -> Optional[Decimal]:
@@ -139,7 +144,7 @@ def get_val() -> Optional[Decimal]:
     try:
         val = Decimal(input().strip())
         return val
-    except (InvalidOperation, ValueError, TypeError):
+    except InvalidOperation:
         raise InvalidInputError("Invalid Value: Please use numbers only.")
 
 
@@ -149,10 +154,15 @@ def display_hist_sci_calc() -> None:
 
 
 def record_history_sci_calc(name: str, val: NumberLike, answer: str) -> None:
-    """Append calculation to history file."""
+    """Queue calculation for the history file."""
     _record_history_impl(name, val, answer, HISTORY_FILE)
 
 
+def flush_hist_sci_calc() -> None:
+    """Write buffered calculations to the history file."""
+    _flush_history_impl(HISTORY_FILE)
+
+
 def clear_hist_sci_calc() -> None:
     """Clear all history by truncating the history file."""
     _clear_history_impl(HISTORY_FILE)
@@ -166,7 +176,12 @@ def validate_subOpNum(sub_op_num: int) -> int:
     return 0
 
 
-trigo_funcs: dict[Tuple[int, int], Tuple[str, Callable[[NumberLike], Decimal]]] = {
+def trigo_key(op_num: int, sub_op_num: int) -> int:
+    """Flatten a (category, sub-operation) pair into a single dispatch key."""
+    return int(op_num) * 10 + int(sub_op_num)
+
+
+_TRIGO_FUNCS_BY_PAIR: dict[Tuple[int, int], Tuple[str, Callable[[NumberLike], Decimal]]] = {
     (FunctionCategory.TRIGONOMETRIC, SubOperation.FUNC_1): ("sin", sine),
     (FunctionCategory.TRIGONOMETRIC, SubOperation.FUNC_2): ("cos", cosine),
     (FunctionCategory.TRIGONOMETRIC, SubOperation.FUNC_3): ("tan", tangent),
@@ -193,6 +208,32 @@ trigo_funcs: dict[Tuple[int, int], Tuple[str, Callable[[NumberLike], Decimal]]]
     (FunctionCategory.INVERSE_HYPERBOLIC, SubOperation.FUNC_6): ("cosech⁻¹", cosech_inv),
 }
 
+trigo_funcs: dict[int, Tuple[str, Callable[[NumberLike], Decimal]]] = {
+    trigo_key(op_num, sub_op_num): entry
+    for (op_num, sub_op_num), entry in _TRIGO_FUNCS_BY_PAIR.items()
+}
+
+# Plain ints for per-call comparisons; FunctionCategory.X is a class attribute lookup.
+_TRIGONOMETRIC = int(FunctionCategory.TRIGONOMETRIC)
+_INVERSE_TRIGONOMETRIC = int(FunctionCategory.INVERSE_TRIGONOMETRIC)
+_HYPERBOLIC = int(FunctionCategory.HYPERBOLIC)
+_INVERSE_HYPERBOLIC = int(FunctionCategory.INVERSE_HYPERBOLIC)
+_FUNC_4 = int(SubOperation.FUNC_4)
+
+# Function category -> domain/asymptote validator, called as validator(sub_op_num, value).
+_CATEGORY_VALIDATORS = {
+    _TRIGONOMETRIC: _validate_trig_asymptote,
+    _HYPERBOLIC: _validate_hyperbolic_asymptote,
+    _INVERSE_TRIGONOMETRIC: _validate_inverse_trig_domain,
+    _INVERSE_HYPERBOLIC: _validate_inverse_hyperbolic_domain,
+}
+
+
+@lru_cache(maxsize=128)
+def _evaluate_cached(func: Callable[[Decimal], Decimal], value: Decimal) -> Decimal:
+    """Memoize a function result; users often repeat the same angles."""
+    return func(value)
+
 
 def validate_and_eval(
     op_num: int,
@@ -203,18 +244,15 @@ def validate_and_eval(
 ) -> str:
     """Validate input domain and execute scientific calculation."""
     try:
-        if op_num == FunctionCategory.TRIGONOMETRIC:
-            _validate_trig_asymptote(sub_op_num, val)
-        elif op_num == FunctionCategory.HYPERBOLIC:
-            _validate_hyperbolic_asymptote(sub_op_num, val)
-        elif op_num == FunctionCategory.INVERSE_TRIGONOMETRIC:
-            _validate_inverse_trig_domain(sub_op_num, val)
-            if sub_op_num == SubOperation.FUNC_4 and _to_decimal(val) == 0:
-                return f"{name}({val}) = 90"
-        elif op_num == FunctionCategory.INVERSE_HYPERBOLIC:
-            _validate_inverse_hyperbolic_domain(sub_op_num, val)
-
-        result = func(_to_decimal(val))
+        val_dec = _to_decimal(val)
+        validator = _CATEGORY_VALIDATORS.get(op_num)
+        if validator is not None:
+            validator(sub_op_num, val_dec)
+        if op_num == _INVERSE_TRIGONOMETRIC and sub_op_num == _FUNC_4 and val_dec == 0:
+            return f"{name}({val}) = 90"
+
+        # Signalling NaNs cannot be hashed, so non-finite input bypasses the cache.
+        result = _evaluate_cached(func, val_dec) if val_dec.is_finite() else func(val_dec)
         formatted_result = format_result(result)
         record_history_sci_calc(name, val, formatted_result)
         return f"{name}({val}) = {formatted_result}"
@@ -227,16 +265,18 @@ def validate_and_eval(
         return f"System Error: {type(e).__name__}"
 
 
-def eval_trigo_func(key: Tuple[int, int]) -> None:
+def eval_trigo_func(key: int) -> None:
     """Evaluate scientific function based on user input."""
     try:
-        if key not in trigo_funcs:
+        entry = trigo_funcs.get(key)
+        if entry is None:
             print("Invalid Key Error: Please select a correct pair of main_menu and sub_menu options.")
+            return
 
-        op_num, sub_op_num = key
-        name, func = trigo_funcs[key]
+        op_num, sub_op_num = divmod(key, 10)
+        name, func = entry
 
-        print("Enter angle:" if op_num == FunctionCategory.TRIGONOMETRIC else "Enter value: ", end="")
+        print("Enter angle:" if op_num == _TRIGONOMETRIC else "Enter value: ", end="")
         val = get_val()
         if val is not None:
             answer = validate_and_eval(op_num, sub_op_num, name, func, val)
@@ -248,36 +288,49 @@ def eval_trigo_func(key: Tuple[int, int]) -> None:
         raise
 
 
+# Operations that take a sub-operation number (trig and hyperbolic families).
+_FUNCTION_OPS = frozenset({
+    SciOperation.TRIG,
+    SciOperation.INVERSE_TRIG,
+    SciOperation.HYPERBOLIC,
+    SciOperation.INVERSE_HYPERBOLIC,
+})
+
+# Menu choice -> handler for the no-argument operations; the function
+# families and QUIT are handled in the loop.
+_SCI_HANDLERS = {
+    SciOperation.SHOW_MENU: sci_calc_menuMsg,
+    SciOperation.SHOW_HISTORY: display_hist_sci_calc,
+    SciOperation.CLEAR_HISTORY: clear_hist_sci_calc,
+}
+
+
 def sci_calc() -> None:
     """Scientific calculator interface loop."""
     while True:
         try:
-            op_num = int(input("\nEnter operation number: "))
-
-            if op_num in (
-                SciOperation.TRIG,
-                SciOperation.INVERSE_TRIG,
-                SciOperation.HYPERBOLIC,
-                SciOperation.INVERSE_HYPERBOLIC,
-            ):
-                sub_op_num = int(input("Enter sub-operation number: "))
+            op_num = read_menu_choice("\nEnter operation number: ")
+            if op_num is None:
+                print("Invalid input: Please use numbers only.")
+                continue
+
+            if op_num in _FUNCTION_OPS:
+                sub_op_num = read_menu_choice("Enter sub-operation number: ")
+                if sub_op_num is None:
+                    print("Invalid input: Please use numbers only.")
+                    continue
 
                 if validate_subOpNum(sub_op_num) == 0:
                     continue
 
-                key = (op_num, sub_op_num)
-                eval_trigo_func(key)
-
-            elif op_num == SciOperation.SHOW_MENU:
-                sci_calc_menuMsg()
-
-            elif op_num == SciOperation.SHOW_HISTORY:
-                display_hist_sci_calc()
+                eval_trigo_func(trigo_key(op_num, sub_op_num))
+                flush_hist_sci_calc()
 
-            elif op_num == SciOperation.CLEAR_HISTORY:
-                clear_hist_sci_calc()
+            elif op_num in _SCI_HANDLERS:
+                _SCI_HANDLERS[op_num]()
 
             elif op_num == SciOperation.QUIT:
+                flush_hist_sci_calc()
                 print("\n Scientific calculator closed!\n")
                 break
             else:
@@ -286,7 +339,7 @@ def sci_calc() -> None:
         except CalculatorError as e:
             print(e)
             continue
-        except (ValueError, TypeError):
+        except ValueError:
             print("Invalid input: Please use numbers only.")
             continue
         except Exception as e:
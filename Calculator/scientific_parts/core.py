@@ -45,12 +45,20 @@ class SubOperation(IntEnum):
 
 
 def _to_decimal(value: NumberLike) -> Decimal:
+    # Exact type checks first: plain Decimal/int are the hot-path inputs.
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    if value_type is int:
+        return Decimal(value)
     if isinstance(value, Decimal):
         return value
     if isinstance(value, int):
         return Decimal(value)
+    # Floats go through their shortest repr so 0.1 stays 0.1, not the
+    # exact binary expansion Decimal(0.1) would give.
     try:
-        return Decimal(str(value))
+        return Decimal(value if value_type is str else str(value))
     except InvalidOperation:
         raise ExpressionError()
     except (TypeError, ValueError):
@@ -75,21 +83,43 @@ def compute_pi() -> Decimal:
 
 
 PI = compute_pi()
-TWO_PI = PI * 2
+
+# Derived constants are built once at full internal precision so the
+# degree/radian helpers cost a single multiply per call.
+with localcontext() as _ctx:
+    _ctx.prec = INTERNAL_PRECISION
+    TWO_PI = PI * 2
+    _QUARTER_PI = PI / 4
+    _HALF_PI = PI / 2
+    _THREE_QUARTER_PI = PI * 3 / 4
+    _DEG2RAD = PI / Decimal(180)
+    _RAD2DEG = Decimal(180) / PI
 
 
 def _radians(angle: Decimal) -> Decimal:
-    return angle * PI / Decimal(180)
+    # Multiply at internal precision so range reduction against TWO_PI cancels.
+    with localcontext() as ctx:
+        ctx.prec = INTERNAL_PRECISION
+        return angle * _DEG2RAD
 
 
 def _degrees(rad: Decimal) -> Decimal:
-    return rad * Decimal(180) / PI
+    with localcontext() as ctx:
+        ctx.prec = INTERNAL_PRECISION
+        return rad * _RAD2DEG
 
 
 def _reduce_radians(x: Decimal) -> Decimal:
+    # Decimal % keeps the dividend's sign, so y starts in (-2pi, 2pi).
     y = x % TWO_PI
+    if not y:
+        # Whole turns leave a zero with a large negative exponent; use plain 0
+        # so the series return exact 0 and 1 instead of padded values.
+        return Decimal(0)
     if y > PI:
         y -= TWO_PI
+    elif y <= -PI:
+        y += TWO_PI
     return y
 
 
@@ -97,16 +127,20 @@ def _sin_decimal(x: Decimal) -> Decimal:
     with localcontext() as ctx:
         ctx.prec = INTERNAL_PRECISION
         x = _reduce_radians(x)
+        x2 = x * x
         term = x
-        result = Decimal(0)
+        result = x
         n = 1
         eps = Decimal(10) ** (-(INTERNAL_PRECISION - 5))
+        # Two terms per iteration halves the convergence checks.
         while True:
+            term *= -x2 / Decimal(2 * n * (2 * n + 1))
+            result += term
+            term *= -x2 / Decimal((2 * n + 2) * (2 * n + 3))
             result += term
-            term *= -x * x / (Decimal(2 * n) * Decimal(2 * n + 1))
             if abs(term) < eps:
                 break
-            n += 1
+            n += 2
         return +result
 
 
@@ -114,19 +148,49 @@ def _cos_decimal(x: Decimal) -> Decimal:
     with localcontext() as ctx:
         ctx.prec = INTERNAL_PRECISION
         x = _reduce_radians(x)
+        x2 = x * x
         term = Decimal(1)
-        result = Decimal(0)
+        result = Decimal(1)
         n = 1
         eps = Decimal(10) ** (-(INTERNAL_PRECISION - 5))
+        # Two terms per iteration halves the convergence checks.
         while True:
+            term *= -x2 / Decimal((2 * n - 1) * (2 * n))
+            result += term
+            term *= -x2 / Decimal((2 * n + 1) * (2 * n + 2))
             result += term
-            term *= -x * x / (Decimal(2 * n - 1) * Decimal(2 * n))
             if abs(term) < eps:
                 break
-            n += 1
+            n += 2
         return +result
 
 
+def _sincos_decimal(x: Decimal) -> tuple[Decimal, Decimal]:
+    """
+    Return (sin x, cos x) from a single Taylor series.
+
+    The smaller of the two comes from its series; the larger (at least
+    1/sqrt(2) in magnitude) from sqrt(1 - other^2), which is well
+    conditioned there.
+    """
+    with localcontext() as ctx:
+        ctx.prec = INTERNAL_PRECISION
+        x = _reduce_radians(x)
+        abs_x = abs(x)
+        # x is in (-pi, pi]: |sin| <= |cos| within pi/4 of 0 or of +-pi.
+        if abs_x <= _QUARTER_PI or abs_x >= _THREE_QUARTER_PI:
+            sin_val = _sin_decimal(x)
+            cos_val = (1 - sin_val * sin_val).sqrt()
+            if abs_x > _HALF_PI:
+                cos_val = -cos_val
+        else:
+            cos_val = _cos_decimal(x)
+            sin_val = (1 - cos_val * cos_val).sqrt()
+            if x < 0:
+                sin_val = -sin_val
+        return +sin_val, +cos_val
+
+
 def _atan_decimal(x: Decimal) -> Decimal:
     with localcontext() as ctx:
         ctx.prec = INTERNAL_PRECISION
@@ -135,16 +199,20 @@ def _atan_decimal(x: Decimal) -> Decimal:
         if abs(x) > 1:
             sign = Decimal(1) if x > 0 else Decimal(-1)
             return sign * (PI / 2) - _atan_decimal(Decimal(1) / x)
+        x2 = x * x
         term = x
         result = term
         n = 1
         eps = Decimal(10) ** (-(INTERNAL_PRECISION - 5))
+        # Two terms per iteration halves the convergence checks.
         while True:
-            term *= -x * x * Decimal(2 * n - 1) / Decimal(2 * n + 1)
+            term *= -x2 * Decimal(2 * n - 1) / Decimal(2 * n + 1)
+            result += term
+            term *= -x2 * Decimal(2 * n + 1) / Decimal(2 * n + 3)
+            result += term
             if abs(term) < eps:
                 break
-            result += term
-            n += 1
+            n += 2
         return +result
 
 
@@ -174,20 +242,35 @@ def _ln_decimal(x: Decimal) -> Decimal:
     return x.ln()
 
 
+def _exp_pair(x: Decimal) -> tuple[Decimal, Decimal]:
+    """Return (e^|x|, e^-|x|) from a single exp; e^|x| >= 1, so 1/e^|x| is safe."""
+    ex = _exp_decimal(abs(x))
+    return ex, 1 / ex
+
+
+# The hyperbolic helpers work at INTERNAL_PRECISION: e^x and e^-x are both
+# close to 1 for tiny x, so their difference needs the extra digits.
 def _sinh_decimal(x: Decimal) -> Decimal:
-    ex = _exp_decimal(x)
-    exn = _exp_decimal(-x)
-    return (ex - exn) / 2
+    with localcontext() as ctx:
+        ctx.prec = INTERNAL_PRECISION
+        ex, exn = _exp_pair(x)
+        result = (ex - exn) / 2
+        return -result if x < 0 else result
 
 
 def _cosh_decimal(x: Decimal) -> Decimal:
-    ex = _exp_decimal(x)
-    exn = _exp_decimal(-x)
-    return (ex + exn) / 2
+    with localcontext() as ctx:
+        ctx.prec = INTERNAL_PRECISION
+        ex, exn = _exp_pair(x)
+        return (ex + exn) / 2
 
 
 def _tanh_decimal(x: Decimal) -> Decimal:
-    return _sinh_decimal(x) / _cosh_decimal(x)
+    with localcontext() as ctx:
+        ctx.prec = INTERNAL_PRECISION
+        ex, exn = _exp_pair(x)
+        result = (ex - exn) / (ex + exn)
+        return -result if x < 0 else result
 
 
 def _asinh_decimal(x: Decimal) -> Decimal:
@@ -202,8 +285,21 @@ def _atanh_decimal(x: Decimal) -> Decimal:
     return _ln_decimal((1 + x) / (1 - x)) / 2
 
 
+# Integral results below this magnitude fit the display width as plain digits.
+_INTEGRAL_DISPLAY_LIMIT = Decimal(10) ** RESULT_PRECISION
+
+
 def format_result(result: NumberLike) -> str:
     """Format numerical result using configured significant precision."""
+    # Exactly integral Decimals (0E-275, -0.000, 100.00, 1E+2) skip the
+    # general formatter, which would keep their exponent or trailing zeros.
+    if (
+        type(result) is Decimal
+        and result.is_finite()
+        and abs(result) < _INTEGRAL_DISPLAY_LIMIT
+        and result == result.to_integral_value()
+    ):
+        return str(int(result))
     return f"{result:.{RESULT_PRECISION}g}"
 
 
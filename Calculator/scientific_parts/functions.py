@@ -15,6 +15,7 @@ from calculator.scientific_parts.core import (
     _degrees,
     _radians,
     _sin_decimal,
+    _sincos_decimal,
     _sinh_decimal,
     _tanh_decimal,
     _to_decimal,
@@ -30,12 +31,13 @@ def cosine(angle: NumberLike) -> Decimal:
 
 
 def tangent(angle: NumberLike) -> Decimal:
-    return _sin_decimal(_radians(_to_decimal(angle))) / _cos_decimal(_radians(_to_decimal(angle)))
+    sin_val, cos_val = _sincos_decimal(_radians(_to_decimal(angle)))
+    return sin_val / cos_val
 
 
 def cot(angle: NumberLike) -> Decimal:
-    rad = _radians(_to_decimal(angle))
-    return _cos_decimal(rad) / _sin_decimal(rad)
+    sin_val, cos_val = _sincos_decimal(_radians(_to_decimal(angle)))
+    return cos_val / sin_val
 
 
 def sec(angle: NumberLike) -> Decimal:
@@ -83,8 +85,7 @@ def tangenth(val: NumberLike) -> Decimal:
 
 
 def coth(val: NumberLike) -> Decimal:
-    val_dec = _to_decimal(val)
-    return _cosh_decimal(val_dec) / _sinh_decimal(val_dec)
+    return Decimal(1) / _tanh_decimal(_to_decimal(val))
 
 
 def sech(val: NumberLike) -> Decimal:
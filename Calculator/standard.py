@@ -8,10 +8,12 @@ from enum import IntEnum
 from decimal import Decimal, InvalidOperation, DivisionByZero, localcontext
 import ast
 import operator
+import sys
+from pathlib import Path
 
 from calculator.exceptions import UnbalancedParenthesesError, ExpressionError, CalculatorError, NullInputError
 from calculator.config import DECIMAL_PRECISION, DISPLAY_PRECISION, STD_HISTORY_FILE
-from calculator.utils import errmsg
+from calculator.utils import errmsg, flush_history, queue_history, read_menu_choice
 
 # ============================================================================
 # Constants
@@ -20,6 +22,9 @@ from calculator.utils import errmsg
 HISTORY_FILE = STD_HISTORY_FILE
 FLOAT_LIKE_MAX_EXP = 308
 MAX_EXPRESSION_LENGTH = 1000  # Prevent DoS attacks
+ALLOWED_EXPRESSION_CHARS = "0123456789+-*/%(). "
+# Deletes every allowed character; anything left over is invalid input.
+_STRIP_ALLOWED_CHARS = str.maketrans("", "", ALLOWED_EXPRESSION_CHARS)
 
 SAFE_OPERATORS = {
     ast.Add: operator.add,
@@ -75,16 +80,23 @@ def format_answer(result: Decimal) -> str:
 # Menu Display Functions
 # ============================================================================
 
+_STD_MENU = "\n".join([
+    "",
+    "=" * 40,
+    "STANDARD CALCULATOR",
+    "=" * 40,
+    "1. Type expression",
+    "2. Show history",
+    "3. Clear history",
+    "4. Quit standard calculator",
+    "=" * 40,
+    "",
+])
+
+
 def std_calc_menuMsg() -> None:
     """Display standard calculator menu options."""
-    print("\n" + "="*40)
-    print("STANDARD CALCULATOR")
-    print("="*40)
-    print("1. Type expression")
-    print("2. Show history")
-    print("3. Clear history")
-    print("4. Quit standard calculator")
-    print("="*40)
+    sys.stdout.write(_STD_MENU)
 
 
 # ============================================================================
@@ -93,43 +105,70 @@ def std_calc_menuMsg() -> None:
 
 def record_history_std_calc(exp: str, result: str) -> None:
     """
-    Append calculation to history file.
+    Queue calculation for the history file.
+
+    Entries are buffered and written on the next flush: once the CLI
+    finishes the operation, on show/clear history, or at interpreter exit.
     
     Args:
         exp: Expression that was evaluated
         result: Computed result
     """
+    queue_history(HISTORY_FILE, f"{exp} = {result}\n")
+
+
+def flush_hist_std_calc() -> None:
+    """Write buffered calculations to the history file."""
+    global _hist_display_cache
     try:
-        with HISTORY_FILE.open('a', encoding="utf-8") as f:
-            f.write(f"{exp} = {result}\n")
+        if flush_history(HISTORY_FILE):
+            _hist_display_cache = None
     except (FileNotFoundError, PermissionError, UnicodeDecodeError, OSError):
         print("Internal Error: Failed to record history")
 
 
+# (path, formatted display block) of the last history shown. This module owns
+# every write to the file, so flushing or clearing drops the cache instead of
+# trusting file stat (coarse mtimes hide same-size rewrites).
+_hist_display_cache: tuple[Path, str] | None = None
+
+
 def display_hist_std_calc() -> None:
     """Display calculation history from file."""
+    global _hist_display_cache
+    flush_hist_std_calc()
     try:
         if not HISTORY_FILE.exists():
             print("No history available.")
             return
-        
+
+        if _hist_display_cache is not None and _hist_display_cache[0] == HISTORY_FILE:
+            print(_hist_display_cache[1])
+            return
+
         history = HISTORY_FILE.read_text(encoding="utf-8").splitlines()
         if not history:
             print("History is empty.")
             return
-            
-        print("\n" + "="*40)
-        print("CALCULATION HISTORY")
-        print("="*40)
-        for line in history:
-            print(f"  {line}")
-        print("="*40 + "\n")
+
+        block = "\n".join([
+            "\n" + "="*40,
+            "CALCULATION HISTORY",
+            "="*40,
+            *(f"  {line}" for line in history),
+            "="*40 + "\n",
+        ])
+        _hist_display_cache = (HISTORY_FILE, block)
+        print(block)
     except (PermissionError, UnicodeDecodeError, OSError):
         print("Internal Error: Failed reading history")
 
 
 def clear_hist_std_calc() -> None:
     """Clear all calculation history from file."""
+    global _hist_display_cache
+    flush_hist_std_calc()
+    _hist_display_cache = None
     try:
         HISTORY_FILE.write_text("", encoding="utf-8")
         print("   History cleared successfully!")
@@ -192,14 +231,12 @@ def _validate_exp_strict(exp: str) -> None:
     if exp.count('(') != exp.count(')'):
         raise UnbalancedParenthesesError()
 
-    # Check for allowed characters
-    allowed_chars = "0123456789+-*/%(). "
-    for char in exp:
-        if char not in allowed_chars:
-            raise ExpressionError(
-                "Error: Invalid Expression. Please enter a valid character "
-                "[0123456789+-*/%(). ]"
-            )
+    # Check for allowed characters in a single C-level pass
+    if exp.translate(_STRIP_ALLOWED_CHARS):
+        raise ExpressionError(
+            "Error: Invalid Expression. Please enter a valid character "
+            f"[{ALLOWED_EXPRESSION_CHARS}]"
+        )
 
 
 def compute_expression(exp: str, *, save_history: bool = True) -> str:
@@ -245,9 +282,14 @@ def _evaluate_node(node: ast.AST) -> Decimal:
     No function calls, no variable access, no string operations.
     """
     if isinstance(node, ast.Constant):
-        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
-            raise ExpressionError("Only numbers are allowed.")
-        return Decimal(str(node.value))
+        value = node.value
+        value_type = type(value)
+        # Integers convert exactly; only floats need the shortest-repr string.
+        if value_type is int:
+            return Decimal(value)
+        if value_type is float:
+            return Decimal(repr(value))
+        raise ExpressionError("Only numbers are allowed.")
 
     if isinstance(node, ast.BinOp):
         left = _evaluate_node(node.left)
@@ -261,9 +303,7 @@ def _evaluate_node(node: ast.AST) -> Decimal:
         op_func = SAFE_OPERATORS[type(node.op)]
         with localcontext() as ctx:
             ctx.prec = max(DECIMAL_PRECISION, 28)
-            result = op_func(left, right)
-
-        return Decimal(str(result))
+            return op_func(left, right)
 
     if isinstance(node, ast.UnaryOp):
         operand = _evaluate_node(node.operand)
@@ -314,6 +354,22 @@ def evaluate_expression(exp: str) -> str:
 # Main Interface Function
 # ============================================================================
 
+def _evaluate_and_print() -> None:
+    """Prompt for an expression, evaluate it and print the result."""
+    exp = exp_input()
+    result = evaluate_expression(exp)
+    print(f" Result: {result}")
+    flush_hist_std_calc()
+
+
+# Menu choice -> handler; QUIT is handled in the loop since it ends it.
+_STD_HANDLERS = {
+    StdOperation.EVALUATE: _evaluate_and_print,
+    StdOperation.SHOW_HISTORY: display_hist_std_calc,
+    StdOperation.CLEAR_HISTORY: clear_hist_std_calc,
+}
+
+
 def std_calc() -> None:
     """
     Standard calculator interface.
@@ -322,29 +378,19 @@ def std_calc() -> None:
     while True:
         std_calc_menuMsg()
         try:
-            op_num = int(input("\nEnter your choice: "))
-
-            if op_num == StdOperation.EVALUATE:
-                exp = exp_input()
-                result = evaluate_expression(exp)
-                print(f" Result: {result}")
-
-            elif op_num == StdOperation.SHOW_HISTORY:
-                display_hist_std_calc()
-
-            elif op_num == StdOperation.CLEAR_HISTORY:
-                clear_hist_std_calc()
+            op_num = read_menu_choice("\nEnter your choice: ")
 
+            handler = _STD_HANDLERS.get(op_num)
+            if handler is not None:
+                handler()
             elif op_num == StdOperation.QUIT:
+                flush_hist_std_calc()
                 print("\n Standard calculator closed!\n")
                 break
             else:
                 print("Invalid input: Please select 1-4")
 
-        except CalculatorError as e:
-            print(e)
-            continue
-        except OverflowError as e:
+        except (CalculatorError, OverflowError) as e:
             print(e)
             continue
         except ValueError:
@@ -1,5 +1,6 @@
 """Test configuration for stable local imports and temp paths."""
 
+import importlib
 import os
 from pathlib import Path
 import shutil
@@ -33,3 +34,30 @@ def tmp_path():
     finally:
         shutil.rmtree(path, ignore_errors=True)
 
+
+# Modules that own a HISTORY_FILE, with the converter class copying it (if any).
+_HISTORY_OWNERS = (
+    ("calculator.standard", None),
+    ("calculator.scientific", None),
+    ("calculator.converters.angle", "AngleConverter"),
+    ("calculator.converters.data", "DataConverter"),
+    ("calculator.converters.pressure", "PressureConverter"),
+    ("calculator.converters.temperature", "TemperatureConverter"),
+    ("calculator.converters.weight", "WeightConverter"),
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_history_files(tmp_path, monkeypatch):
+    """Redirect every history file into tmp_path so tests never write real history."""
+    from calculator.utils import _flush_all_history
+
+    for module_name, converter_name in _HISTORY_OWNERS:
+        module = importlib.import_module(module_name)
+        history_file = tmp_path / module.HISTORY_FILE.name
+        monkeypatch.setattr(module, "HISTORY_FILE", history_file)
+        if converter_name is not None:
+            monkeypatch.setattr(getattr(module, converter_name), "history_file", history_file)
+    yield tmp_path
+    # Write anything still buffered while tmp_path exists, not at interpreter exit.
+    _flush_all_history()
@@ -19,6 +19,7 @@ from calculator.converters.angle import (
     to_deg,
     to_grad,
     convert_angle,
+    convert_angle_choice,
     convert_angle_value,
     angle_converter,
     AngleUnit, angle_conv_funcs, PI,
@@ -195,6 +196,19 @@ class TestConvertAngleFunction:
         assert "0.785398" in ans1 or "0.78539" in ans1  # π/4 ≈ 0.785398
         assert "50" in ans2
 
+    def test_convert_angle_choice_keeps_input_text(self) -> None:
+        """
+        Test that cached conversions keep the angle exactly as entered.
+
+        Input: 1 and 1.0 degrees (equal values, different text)
+        Expected: Results match convert_angle and show each input's own text
+        """
+        assert convert_angle_choice(AngleUnit.DEGREE, Decimal("1")) == convert_angle(
+            "rad", to_rads, "grad", to_grad, Decimal("1")
+        )
+        ans1, _ = convert_angle_choice(AngleUnit.DEGREE, Decimal("1.0"))
+        assert ans1.startswith("rad(1.0)")
+
     def test_convert_angle_value_handles_radian_to_gradian(self) -> None:
         """Generic conversion should correctly route radian to gradian."""
         result = convert_angle_value(PI / 2, AngleUnit.RADIAN, AngleUnit.GRADIAN)
@@ -17,6 +17,7 @@ from calculator.converters.pressure import (
     pressure_converter, pressure_conv_menuMsg,
     PRESSURE_UNIT_ABBREV, PRESSURE_UNIT_NAMES,
     PressureUnit, convert_pressure,
+    PRESSURE_FACTORS, TO_PASCAL_FACTORS,
 )
 
 def _dec(value: Decimal | int | str) -> Decimal:
@@ -391,6 +392,18 @@ class TestPressureLookupTables:
         """
         assert set(PRESSURE_UNIT_NAMES.keys()) == set(PRESSURE_UNIT_ABBREV.keys())
 
+    def test_pressure_pair_factors_match_pascal_round_trip(self) -> None:
+        """
+        Test that every pair factor equals the Pascal round-trip.
+        
+        Expected: PRESSURE_FACTORS[a][b] == to_pa[a] / to_pa[b] for all 6x6 pairs
+        """
+        assert set(PRESSURE_FACTORS) == set(PRESSURE_UNIT_NAMES)
+        for from_unit, row in PRESSURE_FACTORS.items():
+            assert set(row) == set(PRESSURE_UNIT_NAMES)
+            for to_unit, factor in row.items():
+                assert factor == TO_PASCAL_FACTORS[from_unit] / TO_PASCAL_FACTORS[to_unit]
+
 
 # ============================================================================
 # Edge Cases and Invalid Inputs
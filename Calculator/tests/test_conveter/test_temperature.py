@@ -21,6 +21,8 @@ from calculator.converters.temperature import (
     F_to_celsius,
     F_to_kelvin,
     TempUnit, temp_conv_funcs,
+    TEMP_AFFINE_FACTORS, TEMP_CONVERTERS, TemperatureConverter,
+    convert_temperature,
 )
 
 def _dec(value: Decimal | int | str) -> Decimal:
@@ -251,6 +253,36 @@ class TestTemperatureLookupTables:
         for key in invalid_keys:
             assert key not in temp_conv_funcs
 
+    def test_affine_factors_match_conversion_functions(self) -> None:
+        """
+        Test that the (scale, offset) table agrees with the named functions.
+
+        Input: 212 in every supported pair
+        Expected: TemperatureConverter.convert equals temp_conv_funcs[pair]
+        """
+        assert set(TEMP_AFFINE_FACTORS) == set(temp_conv_funcs)
+        assert set(TEMP_CONVERTERS) == set(temp_conv_funcs)
+        converter = TemperatureConverter()
+        for (from_unit, to_unit), (_, _, func) in temp_conv_funcs.items():
+            value = Decimal(212)
+            assert converter.convert(value, from_unit, to_unit) == func(value)
+        assert converter.convert(Decimal(212), TempUnit.FAHRENHEIT, TempUnit.CELSIUS) == 100
+
+    def test_convert_temperature_rejects_same_and_unknown_units(self) -> None:
+        """
+        Test the module-level converter's pair validation.
+
+        Input: (C, C), (0, C), (C, 4)
+        Expected: KeyError for each
+        """
+        for from_unit, to_unit in [
+            (TempUnit.CELSIUS, TempUnit.CELSIUS),
+            (0, TempUnit.CELSIUS),
+            (TempUnit.CELSIUS, TempUnit.QUIT),
+        ]:
+            with pytest.raises(KeyError):
+                convert_temperature(Decimal(1), from_unit, to_unit)
+
 
 # ============================================================================
 # Edge Cases, Physical Constants, Precision
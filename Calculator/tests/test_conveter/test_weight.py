@@ -15,8 +15,9 @@ import pytest
 from decimal import Decimal
 
 from calculator.converters.weight import (
-    convert_weight, weight_converter,
+    convert_weight, weight_converter, WeightConverter,
     WeightUnit, WEIGHT_UNIT_NAMES, WEIGHT_UNIT_ABBREV,
+    TO_KG_FACTORS, WEIGHT_FACTORS,
 )
 
 def _dec(value: Decimal | int | str) -> Decimal:
@@ -357,6 +358,18 @@ class TestWeightLookupTables:
         """
         assert set(WEIGHT_UNIT_NAMES.keys()) == set(WEIGHT_UNIT_ABBREV.keys())
 
+    def test_weight_pair_factors_match_kg_round_trip(self) -> None:
+        """
+        Test that every pair factor equals the kilogram round-trip.
+        
+        Expected: WEIGHT_FACTORS[a][b] == to_kg[a] / to_kg[b] for all 13x13 pairs
+        """
+        assert set(WEIGHT_FACTORS) == set(WEIGHT_UNIT_NAMES)
+        for from_unit, row in WEIGHT_FACTORS.items():
+            assert set(row) == set(WEIGHT_UNIT_NAMES)
+            for to_unit, factor in row.items():
+                assert factor == TO_KG_FACTORS[from_unit] / TO_KG_FACTORS[to_unit]
+
 
 # ============================================================================
 # Edge Cases and Invalid Inputs
@@ -405,6 +418,16 @@ class TestWeightEdgeCases:
         result = convert_weight(Decimal("2.5"), WeightUnit.KILOGRAM, WeightUnit.GRAM)
         _assert_close(result, 2500)
 
+    def test_formatted_result_has_no_trailing_zeros(self) -> None:
+        """
+        Test that displayed results drop zeros carried by Decimal exponents.
+        
+        Input: 2.50 kg to metric tonne
+        Expected: "0.0025"
+        """
+        result = convert_weight(Decimal("2.50"), WeightUnit.KILOGRAM, WeightUnit.METRIC_TONNE)
+        assert WeightConverter().format_result(result) == "0.0025"
+
     def test_fractional_weight_conversion(self) -> None:
         """
         Test conversion with fractional weights.
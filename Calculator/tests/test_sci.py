@@ -32,6 +32,9 @@ from calculator.scientific import (
     format_result,
     validate_subOpNum,
     validate_and_eval,
+    trigo_key,
+    trigo_funcs,
+    eval_trigo_func,
     
     # Trigonometric functions
     sine as sci_sine,
@@ -74,8 +77,16 @@ from calculator.scientific import (
     # History functions
     display_hist_sci_calc,
     record_history_sci_calc,
+    flush_hist_sci_calc,
     clear_hist_sci_calc,
 )
+from calculator.scientific_parts.core import (
+    _cos_decimal,
+    _radians,
+    _sin_decimal,
+    _sincos_decimal,
+    _to_decimal,
+)
 
 def _to_float(value):
     return float(value) if isinstance(value, Decimal) else value
@@ -124,6 +135,7 @@ def temp_sci_history_file(monkeypatch) -> Generator[Path, None, None]:
         temp_file = Path(tmp.name)
     monkeypatch.setattr('calculator.scientific.HISTORY_FILE', temp_file)
     yield temp_file
+    flush_hist_sci_calc()
     if temp_file.exists():
         temp_file.unlink()
 
@@ -153,6 +165,18 @@ class TestUtilityFunctions:
         Expected: "5"
         """
         assert format_result(5.0) == "5"
+
+    def test_format_result_integral_decimals(self) -> None:
+        """
+        Test that exactly integral Decimals print as plain integers.
+        
+        Inputs: 0E-275, -0.00000, 90.000, 1E+2
+        Expected: "0", "0", "90", "100"
+        """
+        assert format_result(Decimal("0E-275")) == "0"
+        assert format_result(Decimal("-0.00000")) == "0"
+        assert format_result(Decimal("90.000")) == "90"
+        assert format_result(Decimal("1E+2")) == "100"
     
     def test_format_result_very_small_number(self) -> None:
         """
@@ -174,6 +198,21 @@ class TestUtilityFunctions:
         result = format_result(1e12)
         assert "1" in result
     
+    @pytest.mark.parametrize("angle", [360, -360])
+    @pytest.mark.parametrize("func, expected", [
+        (sci_sine, "0"),
+        (sci_tangent, "0"),
+        (sci_cosine, "1"),
+    ])
+    def test_full_turn_reduces_exactly(self, func, expected: str, angle: int) -> None:
+        """
+        Test that a full turn cancels against the 60-digit TWO_PI.
+        
+        Input: +/-360 degrees
+        Expected: sin/tan "0" and cos "1", not residual 1e-28 noise
+        """
+        assert format_result(func(angle)) == expected
+    
     def test_validate_subOpNum_valid_range(self) -> None:
         """
         Test that valid sub-operation numbers (1-6) are accepted.
@@ -205,6 +244,52 @@ class TestUtilityFunctions:
         """Parametrized test for invalid sub-operation numbers."""
         assert validate_subOpNum(value) == 0
 
+    def test_trigo_key_flattens_pair(self) -> None:
+        """
+        Test that dispatch keys are flat integers.
+        
+        Input: (TRIGONOMETRIC, FUNC_1), (INVERSE_HYPERBOLIC, FUNC_6)
+        Expected: 11 and 46, resolving to sin and cosech⁻¹
+        """
+        assert trigo_key(FunctionCategory.TRIGONOMETRIC, SubOperation.FUNC_1) == 11
+        assert trigo_key(FunctionCategory.INVERSE_HYPERBOLIC, SubOperation.FUNC_6) == 46
+        assert trigo_funcs[11][0] == "sin"
+        assert trigo_funcs[46][0] == "cosech⁻¹"
+        assert len(trigo_funcs) == 24
+
+    def test_to_decimal_parses_strings_and_float_reprs(self) -> None:
+        """
+        Test that strings parse directly and floats keep their short repr.
+        
+        Inputs: " 1.5 ", 0.1
+        Expected: Decimal("1.5"), Decimal("0.1") (not the binary expansion)
+        """
+        assert _to_decimal(" 1.5 ") == Decimal("1.5")
+        assert _to_decimal(0.1) == Decimal("0.1")
+
+    def test_eval_trigo_func_unknown_key_reports_error(self, capsys) -> None:
+        """
+        Test that an unregistered key is reported instead of raising.
+        
+        Input: key 17 (sub-operation 7 does not exist)
+        Expected: Invalid Key Error message, no KeyError
+        """
+        eval_trigo_func(17)
+        assert "Invalid Key Error" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("angle", [0, 30, 45, 90, 135, 180, -45, -90, -135, -300, 1000045])
+    def test_sincos_matches_separate_series(self, angle: int) -> None:
+        """
+        Test that the fused sin/cos helper agrees with the separate series.
+        
+        Input: angles in every quadrant, including negatives below -180
+        Expected: sine and cosine equal to ~50 digits, with the same signs
+        """
+        rad = _radians(Decimal(angle))
+        sin_val, cos_val = _sincos_decimal(rad)
+        assert abs(sin_val - _sin_decimal(rad)) < Decimal("1e-50")
+        assert abs(cos_val - _cos_decimal(rad)) < Decimal("1e-50")
+
 
 # ============================================================================
 # Test Trigonometric Functions
@@ -290,6 +375,24 @@ class TestTrigonometricFunctions:
             "tan", tangent, 90
         )
         assert "Asymptote" in result_90 or "divide by zero" in result_90.lower()
+
+    @pytest.mark.parametrize("sub_op, func, angle", [
+        (SubOperation.FUNC_3, tangent, -90),
+        (SubOperation.FUNC_5, sec, -270),
+        (SubOperation.FUNC_4, cot, -180),
+        (SubOperation.FUNC_6, cosec, Decimal("-179.99999999999")),
+    ])
+    def test_asymptote_detection_negative_angles(self, sub_op, func, angle) -> None:
+        """
+        Test that asymptotes are detected for negative angles too.
+        
+        Inputs: tan(-90), sec(-270), cot(-180), cosec(-179.99999999999)
+        Expected: Asymptote error messages
+        """
+        result = validate_and_eval(
+            FunctionCategory.TRIGONOMETRIC, sub_op, func.__name__, func, angle
+        )
+        assert "Asymptote" in result
     
     # Cotangent function tests
     def test_cot_standard_angles(self) -> None:
@@ -584,6 +687,16 @@ class TestHyperbolicFunctions:
         )
         assert "Undefined" in result or "divide by zero" in result.lower()
     
+    def test_hyperbolic_small_arguments_keep_precision(self) -> None:
+        """
+        Test that e^x - e^-x does not cancel away digits for tiny x.
+        
+        Inputs: coth(1e-20), tanh(1.23456789e-20)
+        Expected: "1.00000000e+20" and "1.23456789e-20"
+        """
+        assert format_result(sci_coth(Decimal("1e-20"))) == "1.00000000e+20"
+        assert format_result(sci_tangenth(Decimal("1.23456789e-20"))) == "1.23456789e-20"
+    
     def test_sech_at_zero(self) -> None:
         """
         Test sech(0) = 1.
@@ -909,9 +1022,37 @@ class TestHistoryFunctions:
         Expected: File contains the entry
         """
         record_history_sci_calc("sin", 45, "0.707106781")
+        flush_hist_sci_calc()
         content = temp_sci_history_file.read_text()
         assert "sin(45) = 0.707106781" in content
+
+    def test_record_history_is_buffered(self, temp_sci_history_file) -> None:
+        """
+        Test that recorded calculations are held until flushed.
+        
+        Action: Record two calculations, then flush
+        Expected: File untouched before flush, both entries after
+        """
+        temp_sci_history_file.write_text("")
+        record_history_sci_calc("sin", 30, "0.5")
+        record_history_sci_calc("cos", 60, "0.5")
+        assert temp_sci_history_file.read_text() == ""
+        flush_hist_sci_calc()
+        assert temp_sci_history_file.read_text() == "sin(30) = 0.5\ncos(60) = 0.5\n"
     
+    def test_display_history_missing_file(self, temp_sci_history_file, capsys) -> None:
+        """
+        Test that a missing history file is reported once, without an error.
+        
+        Action: Delete the history file, then display history
+        Expected: "No history file found" and no Internal Error
+        """
+        temp_sci_history_file.unlink()
+        display_hist_sci_calc()
+        out = capsys.readouterr().out
+        assert "No history file found" in out
+        assert "Internal Error" not in out
+
     def test_clear_history(self, temp_sci_history_file, capsys) -> None:
         """
         Test that clear_hist_sci_calc empties the file.
@@ -985,9 +1126,35 @@ class TestIntegration:
         assert "0.5" in result
         
         # Check history was recorded
+        flush_hist_sci_calc()
         content = temp_sci_history_file.read_text()
         assert "sin(30)" in content
 
+    def test_repeated_evaluation_reuses_result(self, temp_sci_history_file) -> None:
+        """
+        Test that repeating an input computes once but records every call.
+        
+        Action: Evaluate the same function on 45 twice
+        Expected: One underlying call, identical answers, two history lines
+        """
+        calls = []
+
+        def counted_sine(val: Decimal) -> Decimal:
+            calls.append(val)
+            return sci_sine(val)
+
+        first = validate_and_eval(
+            FunctionCategory.TRIGONOMETRIC, SubOperation.FUNC_1, "sin", counted_sine, 45
+        )
+        second = validate_and_eval(
+            FunctionCategory.TRIGONOMETRIC, SubOperation.FUNC_1, "sin", counted_sine, 45
+        )
+        assert first == second
+        assert len(calls) == 1
+
+        flush_hist_sci_calc()
+        assert temp_sci_history_file.read_text().count("sin(45)") == 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
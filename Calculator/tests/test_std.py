@@ -28,6 +28,7 @@ from calculator.standard import (
     errmsg,
     format_answer,
     record_history_std_calc,
+    flush_hist_std_calc,
     display_hist_std_calc,
     clear_hist_std_calc,
     exp_input,
@@ -54,6 +55,7 @@ def temp_history_file(monkeypatch, tmp_path) -> Generator[Path, None, None]:
     temp_file = tmp_path / "test_history.txt"
     monkeypatch.setattr('calculator.standard.HISTORY_FILE', temp_file)
     yield temp_file
+    flush_hist_std_calc()
 
 
 @pytest.fixture
@@ -489,6 +491,7 @@ class TestHistoryManagement:
         Expected: File exists with correct content
         """
         record_history_std_calc("2+2", "4")
+        flush_hist_std_calc()
         assert temp_history_file.exists()
         assert "2+2 = 4\n" in temp_history_file.read_text()
     
@@ -501,6 +504,7 @@ class TestHistoryManagement:
         """
         original_content = history_with_data.read_text()
         record_history_std_calc("5+5", "10")
+        flush_hist_std_calc()
         new_content = history_with_data.read_text()
         assert original_content in new_content
         assert "5+5 = 10\n" in new_content
@@ -515,6 +519,7 @@ class TestHistoryManagement:
         record_history_std_calc("1+1", "2")
         record_history_std_calc("2+2", "4")
         record_history_std_calc("3+3", "6")
+        flush_hist_std_calc()
         content = temp_history_file.read_text()
         assert content.count("\n") == 3
         assert "1+1 = 2" in content
@@ -536,7 +541,45 @@ class TestHistoryManagement:
         assert "2+2 = 4" in captured.out
         assert "3*3 = 9" in captured.out
         assert "10/2 = 5" in captured.out
+
+    def test_display_history_reuses_unchanged_output(
+        self, history_with_data, capsys, monkeypatch
+    ) -> None:
+        """
+        Test that an unchanged history file is not re-read for display.
+
+        Action: Display twice, failing any file read on the second call
+        Expected: Identical output both times
+        """
+        display_hist_std_calc()
+        first = capsys.readouterr().out
+        monkeypatch.setattr(Path, "read_text", lambda *_, **__: pytest.fail("re-read"))
+        display_hist_std_calc()
+        assert capsys.readouterr().out == first
     
+    def test_display_history_refreshes_after_same_size_rewrite(
+        self, history_with_data, capsys
+    ) -> None:
+        """
+        Test that clearing and re-recording is shown despite identical stat.
+
+        Action: Display, clear, record a same-size history, pin the old mtime
+        Expected: The new entries are displayed, not the cached block
+        """
+        display_hist_std_calc()
+        stat = history_with_data.stat()
+        clear_hist_std_calc()
+        record_history_std_calc("2+2", "4")
+        record_history_std_calc("3*3", "9")
+        record_history_std_calc("10/5", "2")
+        flush_hist_std_calc()
+        os.utime(history_with_data, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        capsys.readouterr()
+        display_hist_std_calc()
+        out = capsys.readouterr().out
+        assert "10/5 = 2" in out
+        assert "10/2 = 5" not in out
+
     def test_display_history_empty_file(self, temp_history_file, capsys) -> None:
         """
         Test display when history file is empty.
@@ -646,7 +689,8 @@ class TestIntegration:
         result = evaluate_expression("10+20")
         assert result == "30"
         
-        # Check file was created
+        # Check file was created once history is flushed
+        flush_hist_std_calc()
         assert temp_history_file.exists()
         content = temp_history_file.read_text()
         assert "10+20 = 30" in content
@@ -668,6 +712,7 @@ class TestIntegration:
         for exp in expressions:
             evaluate_expression(exp)
         
+        flush_hist_std_calc()
         content = temp_history_file.read_text()
         assert content.count("\n") == 5
 
@@ -4,8 +4,82 @@ Core Utilities
 Shared helpers for main modules(standard, scientific, programmer, and router).
 """
 
+import atexit
+import sys
+from pathlib import Path
+
+
+INVALID_INPUT_MESSAGE = "Error: Invalid input.\n"
+
+# Pending history lines per file, written in one append on flush.
+_pending_history: dict[Path, list[str]] = {}
+
 
 def errmsg() -> None:
     """Display standard error message for invalid input."""
-    print("Error: Invalid input.")
+    sys.stdout.write(INVALID_INPUT_MESSAGE)
+
+
+def read_menu_choice(prompt: str) -> int | None:
+    """
+    Prompt for a menu number without raising on bad input.
+
+    Accepts whatever int() accepts, so inputs like "+2" behave as before.
+
+    Args:
+        prompt: Prompt passed to input()
+
+    Returns:
+        The entered integer, or None if the text is not an integer
+    """
+    try:
+        return int(input(prompt))
+    except ValueError:
+        return None
+
+
+def queue_history(history_file: Path, line: str) -> None:
+    """
+    Buffer a history line until the next flush of its file.
+
+    Args:
+        history_file: History file the line belongs to
+        line: Newline-terminated history entry
+    """
+    _pending_history.setdefault(history_file, []).append(line)
+
+
+def flush_history(history_file: Path) -> bool:
+    """
+    Append all buffered lines for a history file in a single write.
+
+    Pending lines are dropped even if the write fails, so a broken history
+    file cannot grow the buffer without bound.
+
+    Args:
+        history_file: History file to flush
+
+    Returns:
+        True if any lines were written, False if nothing was pending
+
+    Raises:
+        OSError: If the history file cannot be opened or written
+    """
+    lines = _pending_history.pop(history_file, None)
+    if not lines:
+        return False
+    with history_file.open("a", encoding="utf-8") as f:
+        f.writelines(lines)
+    return True
+
+
+def _flush_all_history() -> None:
+    """Flush every buffered history file at interpreter shutdown."""
+    for history_file in list(_pending_history):
+        try:
+            flush_history(history_file)
+        except OSError:
+            print(f"Internal Error: Failed to record history in {history_file.name}")
+
 
+atexit.register(_flush_all_history)